@@ -0,0 +1,95 @@
+# animation_sys.py
+import numpy as np
+
+
+class AnimationSystem:
+    """모든 SpriteRenderer의 애니메이션 시계를 NumPy 배열로 보관하고 한 번에 진행시킵니다.
+
+    슬롯 번호는 렌더러가 ObjectManager에 등록되어 있는 동안 바뀌지 않습니다.
+    """
+    def __init__(self, capacity=256):
+        self.timers = np.zeros(capacity, dtype='f8')
+        self.durations = np.zeros(capacity, dtype='f8')
+        self.frame_counts = np.ones(capacity, dtype=np.int32)
+        self.frame_idx = np.zeros(capacity, dtype=np.int32)
+        self.flip = np.zeros(capacity, dtype=bool)
+        # 진행 여부: 재생 중인 애니메이션이 있고, 컴포넌트와 오브젝트가 모두 활성
+        self.enabled = np.zeros(capacity, dtype=bool)
+        self.owners = [None] * capacity
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+    @property
+    def capacity(self):
+        return len(self.owners)
+
+    def _grow(self):
+        old = self.capacity
+        new = old * 2
+        for field in ('timers', 'durations', 'frame_counts', 'frame_idx', 'flip', 'enabled'):
+            arr = getattr(self, field)
+            grown = np.zeros(new, dtype=arr.dtype)
+            grown[:old] = arr
+            setattr(self, field, grown)
+        self.frame_counts[old:] = 1
+        self.owners.extend([None] * (new - old))
+        self.free_slots.extend(range(new - 1, old - 1, -1))
+
+    def attach(self, renderer):
+        """렌더러의 현재 시계 값을 배열로 옮깁니다."""
+        if not self.free_slots:
+            self._grow()
+        slot = self.free_slots.pop()
+
+        self.timers[slot] = renderer._timer
+        self.frame_idx[slot] = renderer._frame_idx
+        self.flip[slot] = renderer._flip_x
+        self.owners[slot] = renderer
+        renderer._anim_slot = slot
+        self.set_clip(renderer)
+        self.sync_enabled(renderer)
+
+    def detach(self, renderer):
+        """배열의 값을 렌더러로 돌려주고 슬롯을 반납합니다."""
+        slot = renderer._anim_slot
+        renderer._timer = float(self.timers[slot])
+        renderer._frame_idx = int(self.frame_idx[slot])
+        renderer._flip_x = bool(self.flip[slot])
+        renderer._anim_slot = None
+
+        self.enabled[slot] = False
+        self.owners[slot] = None
+        self.free_slots.append(slot)
+
+    def set_clip(self, renderer):
+        """재생 중인 애니메이션의 길이/프레임 수를 반영 (play 시 호출)"""
+        slot = renderer._anim_slot
+        anim = renderer.current_anim
+        if anim is None:
+            self.durations[slot] = 0.0
+            self.frame_counts[slot] = 1
+        else:
+            self.durations[slot] = anim.duration
+            self.frame_counts[slot] = anim.total_frames
+
+    def sync_enabled(self, renderer):
+        self.enabled[renderer._anim_slot] = (renderer.current_anim is not None and
+                                             renderer._active and renderer.game_object.active)
+
+    def advance(self, dt):
+        """SpriteRenderer.update와 같은 규칙을 모든 슬롯에 한 번에 적용:
+        타이머가 duration을 넘으면 0으로 되돌리고 다음 프레임으로 넘어감"""
+        enabled = self.enabled
+        self.timers[enabled] += dt
+        wrapped = np.flatnonzero(enabled & (self.timers >= self.durations))
+        if len(wrapped):
+            self.timers[wrapped] = 0.0
+            self.frame_idx[wrapped] = (self.frame_idx[wrapped] + 1) % self.frame_counts[wrapped]
+
+    def clear(self):
+        for renderer in self.owners:
+            if renderer is not None:
+                self.detach(renderer)
+
+
+# 모듈 레벨 싱글톤 인스턴스
+sys_animation = AnimationSystem()
@@ -2,6 +2,8 @@
 import pygame
 from settings import *
 from graphic_sys import sys_graphics
+from texture_sys import sys_textures
+from profiler import sys_profiler
 from scene_sys import sys_scenes
 from game_object import sys_objects
 
@@ -21,23 +23,72 @@ class GameInstance:
         sys_graphics.initialize()
 
     def run(self):
+        step = 1.0 / TICK_RATE
+        accumulator = 0.0
+
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
+            sys_profiler.next_frame()
+            sys_profiler.begin("Frame")
 
             # 1. 입력 처리
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
+            with sys_profiler.scope("Input"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+                        # 최근 프레임들의 스코프 기록을 Chrome trace 파일로 저장
+                        print(f"Profiler trace saved: {sys_profiler.export_chrome_trace()}")
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        sys_graphics.toggle_overlay()
 
             # 2. 업데이트
-            sys_scenes.update(dt)
-            sys_objects.update_all(dt)
+            if FIXED_TIMESTEP:
+                # 고정 스텝: 쌓인 시간만큼 일정한 dt로 여러 번 갱신 (최대 MAX_CATCHUP_STEPS번)
+                accumulator += dt
+                steps = 0
+                while accumulator >= step and steps < MAX_CATCHUP_STEPS:
+                    with sys_profiler.scope("Tick"):
+                        sys_objects.store_previous_transforms()
+                        with sys_profiler.scope("Scene.update"):
+                            sys_scenes.update(step)
+                        with sys_profiler.scope("Objects.update"):
+                            sys_objects.update_all(step)
+                    accumulator -= step
+                    steps += 1
+
+                # 따라잡지 못한 시간은 버림 (느린 프레임이 다음 프레임을 더 느리게 만드는 악순환 방지)
+                if accumulator >= step:
+                    accumulator %= step
+
+                # 렌더링은 직전 틱과 현재 틱 사이를 보간
+                sys_objects.set_interpolation(accumulator / step)
+            else:
+                with sys_profiler.scope("Scene.update"):
+                    sys_scenes.update(dt)
+                with sys_profiler.scope("Objects.update"):
+                    sys_objects.update_all(dt)
+
+            # 3. 디코딩이 끝난 텍스처를 프레임 예산만큼 GPU로 업로드
+            with sys_profiler.scope("Textures.upload"):
+                if sys_textures.process_uploads():
+                    sys_objects.refresh_bounds()  # 스프라이트 크기가 바뀌었으니 컬링 경계 갱신
+
+            # 4. 렌더링
+            with sys_profiler.scope("Render"):
+                sys_graphics.begin_frame()  # 화면 클리어 + 카메라 UBO 갱신 (프레임당 1회)
+                with sys_profiler.scope("Scene.render"):
+                    sys_scenes.render()
+                with sys_profiler.scope("Objects.render"):
+                    sys_objects.render_all()
+                with sys_profiler.scope("Graphics.flush"):
+                    sys_graphics.flush()  # 렌더 큐 정렬 후 실제 드로우
+                sys_graphics.end_frame()  # 통계 확정 + GPU 타이머 종료 (오버레이가 켜져 있으면 그림)
 
-            # 3. 렌더링
-            sys_graphics.clear()
-            sys_scenes.render()
-            sys_objects.render_all()
+            with sys_profiler.scope("Display.flip"):
+                pygame.display.flip()
 
-            pygame.display.flip()
+            sys_profiler.end()  # Frame
 
+        sys_textures.shutdown()
         pygame.quit()
\ No newline at end of file
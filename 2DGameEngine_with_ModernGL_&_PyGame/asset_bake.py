@@ -0,0 +1,154 @@
+# asset_bake.py
+# resources/ 아래의 PNG를 미리 RGBA 원본 바이트로 풀어서 저장합니다 (오프라인 베이크).
+# TextureManager는 베이크된 파일을 memmap으로 바로 읽어 GPU에 올리므로 시작할 때 PNG 디코딩이 없습니다.
+# 사용 예: python asset_bake.py --src resources --out baked
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from settings import BAKED_ASSET_DIR
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# 파일명 끝의 "_가로X세로X프레임수" (예: PLAYER_IDLE_F_16X23X4.png)
+SLICE_PATTERN = re.compile(r'_(\d+)[xX](\d+)[xX](\d+)\.png$')
+
+
+def asset_key(path):
+    """매니페스트 키: 현재 작업 디렉터리 기준 상대 경로 ('./resources/a.png' == 'resources/a.png')"""
+    return os.path.relpath(path).replace(os.sep, '/')
+
+
+def source_stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def parse_slice(path):
+    match = SLICE_PATTERN.search(path)
+    if not match:
+        return None
+    return {
+        'frame_width': int(match.group(1)),
+        'frame_height': int(match.group(2)),
+        'frames': int(match.group(3)),
+    }
+
+
+def bake_one(src_path, blob_path):
+    """(작업 프로세스) PNG 하나를 디코딩해 원본 RGBA 바이트로 저장하고 매니페스트 항목을 돌려줌"""
+    from PIL import Image
+
+    with open(src_path, 'rb') as f:
+        encoded = f.read()
+    mtime_ns, size = source_stamp(src_path)
+
+    img = Image.open(src_path).convert('RGBA')
+    os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+    tmp_path = blob_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(img.tobytes())
+    os.replace(tmp_path, blob_path)  # 중간에 끊겨도 반쯤 쓴 파일이 남지 않게
+
+    return {
+        'width': img.size[0],
+        'height': img.size[1],
+        'format': 'RGBA8',
+        'hash': hashlib.sha1(encoded).hexdigest(),
+        'source_mtime_ns': mtime_ns,
+        'source_size': size,
+        'slice': parse_slice(src_path),
+    }
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def find_sources(src_dir):
+    for root, _, files in os.walk(src_dir):
+        for name in sorted(files):
+            if name.lower().endswith('.png'):
+                yield os.path.join(root, name)
+
+
+def is_up_to_date(entry, src_path, out_dir):
+    """원본의 크기/수정 시각이 같고 베이크 파일이 온전하면 다시 굽지 않음"""
+    if entry is None:
+        return False
+    mtime_ns, size = source_stamp(src_path)
+    if entry['source_mtime_ns'] != mtime_ns or entry['source_size'] != size:
+        return False
+    blob_path = os.path.join(out_dir, entry['blob'])
+    return (os.path.exists(blob_path) and
+            os.path.getsize(blob_path) == entry['width'] * entry['height'] * 4)
+
+
+def bake(src_dir, out_dir, jobs=None, force=False):
+    old = load_manifest(out_dir)
+    old_assets = old['assets'] if old and not force else {}
+
+    assets = {}
+    work = {}  # Key: 매니페스트 키, Value: (원본 경로, 베이크 파일 상대 경로)
+    for src_path in find_sources(src_dir):
+        key = asset_key(src_path)
+        blob = os.path.splitext(os.path.relpath(src_path, src_dir))[0] + ".rgba"
+        blob = blob.replace(os.sep, '/')
+        entry = old_assets.get(key)
+        if not force and is_up_to_date(entry, src_path, out_dir):
+            assets[key] = entry
+        else:
+            work[key] = (src_path, blob)
+
+    if work:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                key: pool.submit(bake_one, src_path, os.path.join(out_dir, blob))
+                for key, (src_path, blob) in work.items()
+            }
+            for key, future in futures.items():
+                entry = future.result()
+                entry['blob'] = work[key][1]
+                assets[key] = entry
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'source_root': asset_key(src_dir),
+        'assets': dict(sorted(assets.items())),
+    }
+    tmp_path = os.path.join(out_dir, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(out_dir, MANIFEST_NAME))
+    return len(work), len(assets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake PNG sprite sheets into raw RGBA blobs")
+    parser.add_argument('--src', default='resources', help="원본 PNG 폴더")
+    parser.add_argument('--out', default=BAKED_ASSET_DIR, help="베이크 결과 폴더")
+    parser.add_argument('--jobs', type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--force', action='store_true', help="바뀌지 않은 파일도 다시 굽기")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    baked, total = bake(args.src, args.out, args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+    print(f"Baked {baked} / {total} textures into '{args.out}' ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
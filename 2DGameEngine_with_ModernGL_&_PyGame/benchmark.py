@@ -0,0 +1,151 @@
+# benchmark.py
+# 창 없이(헤드리스) 스프라이트 렌더링 처리량을 측정합니다.
+# 사용 예: python benchmark.py --sprites 5000 --frames 300 --out bench.json
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import time
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from graphic_sys import sys_graphics
+from texture_sys import sys_textures
+from object_manager import sys_objects
+from game_object import GameObject
+from sprite_renderer import SpriteRenderer
+from camera import Camera
+
+# 파일명 끝의 "_가로X세로X프레임수" (예: PLAYER_IDLE_F_16X23X4.png)
+SHEET_PATTERN = re.compile(r'_(\d+)[xX](\d+)[xX](\d+)\.png$')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Headless sprite rendering benchmark")
+    parser.add_argument('--sprites', type=int, default=2000, help="생성할 SpriteRenderer 오브젝트 수")
+    parser.add_argument('--frames', type=int, default=300, help="측정할 프레임 수")
+    parser.add_argument('--warmup', type=int, default=30, help="측정 전에 버릴 프레임 수")
+    parser.add_argument('--textures', type=int, default=0, help="사용할 스프라이트 시트 수 (0이면 전부)")
+    parser.add_argument('--static', action='store_true', help="애니메이션 없이 첫 프레임만 그림")
+    parser.add_argument('--spread', type=float, default=1.0, help="화면 크기 대비 배치 범위 배수 (1보다 크면 컬링 발생)")
+    parser.add_argument('--no-batch', action='store_true', help="인스턴싱 배치 끄기")
+    parser.add_argument('--no-atlas', action='store_true', help="텍스처 아틀라스 끄기")
+    parser.add_argument('--no-cull', action='store_true', help="카메라 컬링 끄기")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--out', default=None, help="결과 JSON 파일 경로 (없으면 표준 출력)")
+    return parser.parse_args()
+
+
+def find_sheets(limit):
+    paths = sorted(glob.glob(os.path.join('resources', '**', '*.png'), recursive=True))
+    sheets = []
+    for path in paths:
+        match = SHEET_PATTERN.search(path)
+        frames = int(match.group(3)) if match else 1
+        sheets.append((path, frames))
+    if limit > 0:
+        sheets = sheets[:limit]
+    return sheets
+
+
+def spawn_sprites(count, sheets, spread, animated):
+    half_w = SCREEN_WIDTH * spread / 2
+    half_h = SCREEN_HEIGHT * spread / 2
+    center_x = SCREEN_WIDTH / 2
+    center_y = SCREEN_HEIGHT / 2
+
+    for i in range(count):
+        path, frames = sheets[i % len(sheets)]
+        obj = GameObject("BenchSprite",
+                         random.uniform(center_x - half_w, center_x + half_w),
+                         random.uniform(center_y - half_h, center_y + half_h))
+        renderer = obj.add_component(SpriteRenderer)
+        renderer.add_animation("Default", path, frames if animated else 1, 1,
+                               duration=random.uniform(0.08, 0.2))
+        renderer.set_scale(2.0)
+
+
+def run_frame(dt, timings):
+    t0 = time.perf_counter()
+    sys_objects.update_all(dt)
+    t1 = time.perf_counter()
+
+    sys_graphics.begin_frame()
+    sys_objects.render_all()
+    sys_graphics.flush()
+    sys_graphics.end_frame()
+    sys_graphics.ctx.finish()  # GPU 작업까지 끝나야 렌더 시간에 포함됨
+    t2 = time.perf_counter()
+
+    if timings is not None:
+        timings['update'] += t1 - t0
+        timings['render'] += t2 - t1
+        stats = sys_graphics.get_stats()
+        timings['draw_calls'] += stats['draw_calls']
+        timings['texture_binds'] += stats['texture_binds']
+        timings['uniform_writes'] += stats['uniform_writes']
+        if stats['gpu_ms'] is not None:
+            timings['gpu'] += stats['gpu_ms']
+            timings['gpu_samples'] += 1
+
+
+def main():
+    args = parse_args()
+    random.seed(args.seed)
+
+    sys_graphics.initialize(headless=True)
+    sys_graphics.batch_mode = not args.no_batch
+    sys_textures.atlas_mode = not args.no_atlas
+    sys_objects.culling = not args.no_cull
+
+    sheets = find_sheets(args.textures)
+    Camera(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+    spawn_sprites(args.sprites, sheets, args.spread, not args.static)
+    # 측정 구간에 업로드가 섞이지 않도록 비동기 로드를 먼저 끝냄
+    sys_textures.wait_for_uploads()
+    sys_objects.refresh_bounds()
+
+    dt = 1.0 / 60.0
+    for _ in range(args.warmup):
+        run_frame(dt, None)
+
+    timings = {'update': 0.0, 'render': 0.0, 'draw_calls': 0, 'texture_binds': 0, 'uniform_writes': 0,
+               'gpu': 0.0, 'gpu_samples': 0}
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        run_frame(dt, timings)
+    elapsed = time.perf_counter() - start
+
+    frames = args.frames
+    result = {
+        'sprites': args.sprites,
+        'frames': frames,
+        'fps': frames / elapsed if elapsed > 0 else 0.0,
+        'frame_ms': elapsed / frames * 1000.0,
+        'update_ms': timings['update'] / frames * 1000.0,
+        'render_ms': timings['render'] / frames * 1000.0,
+        'gpu_ms': timings['gpu'] / timings['gpu_samples'] if timings['gpu_samples'] else None,
+        'draw_calls_per_frame': timings['draw_calls'] / frames,
+        'texture_binds_per_frame': timings['texture_binds'] / frames,
+        'uniform_writes_per_frame': timings['uniform_writes'] / frames,
+        'renderer': sys_graphics.ctx.info.get('GL_RENDERER', ''),
+        'config': {
+            'textures': len(sheets),
+            'animated': not args.static,
+            'spread': args.spread,
+            'batch': sys_graphics.batch_mode,
+            'atlas': sys_textures.atlas_mode,
+            'culling': sys_objects.culling,
+        },
+    }
+
+    text = json.dumps(result, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,14 @@ class Camera(GameObject):
     def __init__(self, x=0, y=0):
         # 1. GameObject 상속 (이제 카메라 위치는 self.position에 저장됨)
         super().__init__("Camera", x, y)
-        self.zoom = 1.0
+        self._zoom = 1.0
+
+        # 뷰-투영 행렬 캐시 (위치/줌이 바뀐 프레임에만 다시 계산)
+        self._vp_matrix = np.identity(4, dtype='f4')
+        self._view_matrix = np.identity(4, dtype='f4')
+        self._cached_pos = None
+        self._dirty = True
+        self.version = 0  # 행렬이 다시 계산될 때마다 증가 (UBO 업로드 판단용)
 
         # 투영 행렬 (Projection)
         self.projection = create_ortho_projection(
@@ -33,11 +40,38 @@ class Camera(GameObject):
         super().update(dt)
         # 카메라 흔들림(Shake) 효과 등이 필요하면 여기에 구현
 
+    @property
+    def zoom(self):
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, value):
+        if value != self._zoom:
+            self._zoom = value
+            self._dirty = True
+
+    def is_dirty(self):
+        # position은 리스트라 외부에서 직접 수정되므로 마지막 계산 때의 값과 비교
+        # (고정 스텝 모드에서는 보간된 위치 기준)
+        pos = self.get_render_position()
+        return self._dirty or self._cached_pos != (pos[0], pos[1])
+
+    def get_visible_rect(self):
+        """카메라가 비추는 월드 영역 (left, bottom, right, top), 줌 반영"""
+        half_w = SCREEN_WIDTH / 2 / self._zoom
+        half_h = SCREEN_HEIGHT / 2 / self._zoom
+        x, y = self.get_render_position()
+        return x - half_w, y - half_h, x + half_w, y + half_h
+
     def get_view_projection_matrix(self):
+        if self.is_dirty():
+            self._rebuild_view_projection()
+        return self._vp_matrix
+
+    def _rebuild_view_projection(self):
         # 1. 뷰 변환 (카메라 위치가 세상의 중심이 되도록 이동)
-        # self.position은 GameObject의 속성 사용
-        cam_x = self.position[0]
-        cam_y = self.position[1]
+        # GameObject의 위치 사용 (고정 스텝 모드에서는 보간된 위치)
+        cam_x, cam_y = self.get_render_position()
 
         # 2. 화면 중앙 보정 (Center Offset)
         # 카메라 좌표가 화면의 '중앙'을 가리키도록 함
@@ -45,19 +79,19 @@ class Camera(GameObject):
         offset_x = SCREEN_WIDTH / 2
         offset_y = SCREEN_HEIGHT / 2
 
-        # 3. 행렬 생성 (역행렬 개념: 카메라는 반대로 이동해야 세상이 움직여 보임)
-        # 이동: (-CameraPos + ScreenCenter)
-        view_translate = np.identity(4, dtype='f4')
-        view_translate[3, 0] = -cam_x * self.zoom + offset_x
-        view_translate[3, 1] = -cam_y * self.zoom + offset_y
-
-        # 줌 (Scale)
-        view_scale = np.identity(4, dtype='f4')
-        view_scale[0, 0] = self.zoom
-        view_scale[1, 1] = self.zoom
+        # 3. 뷰 행렬 = Zoom(Scale) @ Translate 를 곱셈 없이 바로 채움
+        # 이동: (-CameraPos * Zoom + ScreenCenter)
+        view = self._view_matrix
+        view[0, 0] = self._zoom
+        view[1, 1] = self._zoom
+        view[3, 0] = -cam_x * self._zoom + offset_x
+        view[3, 1] = -cam_y * self._zoom + offset_y
 
-        # 순서: Zoom -> Translate (여기선 단순화를 위해 결합된 로직 사용)
-        view_matrix = view_scale @ view_translate
+        # VP 행렬 (미리 잡아둔 버퍼에 기록)
+        # 행 벡터 기준(v @ M @ V @ P)이므로 뷰를 먼저, 투영을 나중에 곱해야
+        # 카메라 위치가 화면 중앙에 오고 get_visible_rect와 일치합니다.
+        np.matmul(view, self.projection, out=self._vp_matrix)
 
-        # VP 행렬 반환
-        return self.projection @ view_matrix
\ No newline at end of file
+        self._cached_pos = (cam_x, cam_y)
+        self._dirty = False
+        self.version += 1
\ No newline at end of file
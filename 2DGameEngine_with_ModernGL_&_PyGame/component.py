@@ -1,10 +1,28 @@
 # --- Components ---
 class Component:
+    # 시스템 업데이트 순서 (작을수록 먼저, 같으면 처음 등록된 타입 순)
+    update_order = 0
+    # True면 개별 update 대신 별도 시스템이 배열로 한꺼번에 갱신 (ObjectManager가 건너뜀)
+    batched_update = False
+
     def __init__(self, game_object):
         self.game_object = game_object
         self.name = None
         self.active = True
+        self._registry_index = None  # ObjectManager 타입별 리스트에서의 위치
 
     def update(self, dt): pass
 
-    def render(self): pass
\ No newline at end of file
+    # 컬링용 경계 (반폭, 반높이). 그려지는 크기가 있는 컴포넌트만 재정의
+    def get_half_extents(self): return None
+
+    def render(self): pass
+
+    # ObjectManager에 등록/해제될 때, 소유 오브젝트의 active가 바뀔 때 호출
+    def on_register(self): pass
+    def on_unregister(self): pass
+    def on_active_changed(self): pass
+
+    # 풀에서 꺼낼 때 / 반납할 때 호출되는 리셋 훅 (object_pool)
+    def on_acquire(self): pass
+    def on_release(self): pass
\ No newline at end of file
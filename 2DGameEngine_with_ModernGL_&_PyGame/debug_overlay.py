@@ -0,0 +1,96 @@
+# debug_overlay.py
+import moderngl
+import pygame
+
+
+class StatsOverlay:
+    """렌더링 통계를 화면 왼쪽 위에 글자로 그립니다 (pygame.font -> 텍스처).
+
+    글자는 refresh_interval마다 한 번만 다시 그려서 텍스처로 올립니다.
+    """
+    def __init__(self, ctx, quad_vbo, screen_size, refresh_interval=0.25, font_size=16):
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self.ctx = ctx
+        self.font = pygame.font.Font(None, font_size)
+        self.screen_size = screen_size
+        self.refresh_interval = refresh_interval
+        self.last_refresh = -1.0
+        self.texture = None
+        self.lines = []
+
+        # 카메라와 무관하게 화면 좌표(NDC)로 바로 그리는 작은 프로그램
+        self.prog = ctx.program(
+            vertex_shader="""
+            #version 330
+            in vec2 in_vert;
+            in vec2 in_uv;
+            out vec2 v_uv;
+            uniform vec2 u_center;  // NDC
+            uniform vec2 u_size;    // NDC
+
+            void main() {
+                v_uv = in_uv;
+                gl_Position = vec4(u_center + in_vert * u_size, 0.0, 1.0);
+            }
+            """,
+            fragment_shader="""
+            #version 330
+            in vec2 v_uv;
+            out vec4 f_color;
+            uniform sampler2D u_texture;
+
+            void main() {
+                f_color = texture(u_texture, v_uv);
+            }
+            """
+        )
+        self.vao = ctx.vertex_array(self.prog, [(quad_vbo, '2f 2f', 'in_vert', 'in_uv')])
+
+    def _format(self, stats, gpu_ms):
+        gpu = f"{gpu_ms:.2f} ms" if gpu_ms is not None else "n/a"
+        return [
+            f"GPU        {gpu}",
+            f"Draw calls {stats['draw_calls']}",
+            f"Sprites    {stats['sprites']}",
+            f"Vertices   {stats['vertices']}",
+            f"Tex binds  {stats['texture_binds']} (skipped {stats['texture_binds_skipped']})",
+            f"Uniforms   {stats['uniform_writes']} (skipped {stats['uniform_writes_skipped']})",
+        ]
+
+    def _rebuild(self, lines):
+        line_h = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 8
+        height = line_h * len(lines) + 8
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 160))
+        for i, line in enumerate(lines):
+            surface.blit(self.font.render(line, True, (255, 255, 255)), (4, 4 + i * line_h))
+
+        # 첫 행이 텍스처 v=0 (쿼드 위쪽)이 되도록 뒤집지 않고 올림
+        data = pygame.image.tostring(surface, 'RGBA', False)
+        if self.texture is None or self.texture.size != (width, height):
+            if self.texture is not None:
+                self.texture.release()
+            self.texture = self.ctx.texture((width, height), 4, data)
+            self.texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        else:
+            self.texture.write(data)
+        self.lines = lines
+
+    def draw(self, stats, gpu_ms, now):
+        if now - self.last_refresh >= self.refresh_interval:
+            self.last_refresh = now
+            lines = self._format(stats, gpu_ms)
+            if lines != self.lines:
+                self._rebuild(lines)
+
+        sw, sh = self.screen_size
+        w, h = self.texture.size
+        # 픽셀 (8, 8)에서 시작하는 왼쪽 위 사각형을 NDC로
+        self.prog['u_center'].value = ((8 + w / 2) / sw * 2 - 1, 1 - (8 + h / 2) / sh * 2)
+        self.prog['u_size'].value = (w / sw * 2, h / sh * 2)
+        self.prog['u_texture'].value = 0
+        self.texture.use(location=0)
+        self.vao.render(moderngl.TRIANGLE_STRIP)
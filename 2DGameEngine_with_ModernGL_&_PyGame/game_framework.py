@@ -10,6 +10,8 @@ from object_manager import sys_objects
 from game_object import GameObject
 from component import Component
 from sprite_renderer import SpriteRenderer
+from tilemap import Tilemap
+from object_pool import ObjectPool, sys_pools
 
 # (선택 사항) 자주 쓰는 외부 라이브러리도 여기서 관리 가능
 import pygame
\ No newline at end of file
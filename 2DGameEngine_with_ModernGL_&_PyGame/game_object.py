@@ -1,22 +1,159 @@
+import math
 from object_manager import sys_objects
 
 # --- Game Object ---
 class GameObject:
+    # update를 재정의한 클래스만 시스템 업데이트에서 오브젝트 단위로 호출됨
+    has_custom_update = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.has_custom_update = cls.update is not GameObject.update
+
     def __init__(self, name="GameObject", x=0, y=0):
         self.name = name
-        self.position = [x, y]
-        self.scale = [100, 100]
+        # 트랜스폼: SoA 백엔드가 켜져 있으면 sys_objects.add에서 배열 프록시로 교체됨
+        self._transforms = None
+        self._transform_slot = None
+        self._position = [x, y]
+        self._prev_position = [x, y]  # 고정 스텝 보간용 (직전 틱 위치)
+        self._scale = [100, 100]
+        self._rotation = 0.0
+        self._prev_rotation = 0.0  # 고정 스텝 보간용 (직전 틱 회전)
+        self._active = True
         self.components = []
-        self.active = True
+        self._components_by_type = {}  # Key: 클래스(MRO 전체), Value: 처음 추가된 컴포넌트
+        self._registered = False  # ObjectManager에 등록되어 있는지
+        self._list_name = name    # ObjectManager.objects에서의 키와 인덱스 (swap-remove용)
+        self._list_index = None
+        self._spawn_index = 0     # 등록 순서 (렌더 큐에서 정렬 키가 같을 때의 순서)
+        self._pool = None         # ObjectPool에서 만들어졌으면 그 풀
+        self._in_pool = False     # 풀에 반납되어 대기 중인지
         sys_objects.add(self)
 
+    # --- Transform ---
+    # 기존처럼 obj.position[0] += ... 또는 obj.scale = [w, h] 형태로 그대로 사용 가능
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position[0] = value[0]
+        self._position[1] = value[1]
+
+    def reset_interpolation(self):
+        """순간 이동 후 호출: 직전 틱 위치도 현재 위치로 맞춰 보간으로 미끄러지지 않게 함"""
+        if self._transforms is not None:
+            slot = self._transform_slot
+            self._transforms.prev_positions[slot] = self._transforms.positions[slot]
+            self._transforms.render_positions[slot] = self._transforms.positions[slot]
+            self._transforms.prev_rotations[slot] = self._transforms.rotations[slot]
+            self._transforms.render_rotations[slot] = self._transforms.rotations[slot]
+        else:
+            self._prev_position[0] = self._position[0]
+            self._prev_position[1] = self._position[1]
+            self._prev_rotation = self._rotation
+
+    def get_render_position(self):
+        """그릴 때 쓸 위치: 고정 스텝 모드에서는 직전 틱과 현재 틱 사이를 보간"""
+        alpha = sys_objects.interpolation_alpha
+        if alpha is None:
+            return self._position
+        if self._transforms is not None:
+            return self._transforms.render_positions[self._transform_slot]
+        prev = self._prev_position
+        cur = self._position
+        return (prev[0] + (cur[0] - prev[0]) * alpha,
+                prev[1] + (cur[1] - prev[1]) * alpha)
+
+    def get_render_rotation(self):
+        """그릴 때 쓸 회전: 고정 스텝 모드에서는 짧은 쪽으로 보간"""
+        alpha = sys_objects.interpolation_alpha
+        if alpha is None:
+            return self.rotation
+        if self._transforms is not None:
+            return self._transforms.render_rotations[self._transform_slot]
+        prev = self._prev_rotation
+        diff = (self._rotation - prev + math.pi) % (2 * math.pi) - math.pi
+        return prev + diff * alpha
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        self._scale[0] = value[0]
+        self._scale[1] = value[1]
+
+    @property
+    def rotation(self):
+        if self._transforms is not None:
+            return self._transforms.rotations[self._transform_slot]
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value):
+        if self._transforms is not None:
+            self._transforms.rotations[self._transform_slot] = value
+        else:
+            self._rotation = value
+
+    @property
+    def active(self):
+        if self._transforms is not None:
+            return self._transforms.active[self._transform_slot]
+        return self._active
+
+    @active.setter
+    def active(self, value):
+        if self._transforms is not None:
+            self._transforms.active[self._transform_slot] = value
+        else:
+            self._active = value
+        if self._registered:
+            sys_objects.set_active(self)
+        for component in self.components:
+            component.on_active_changed()
+
     def add_component(self, component_cls, name=None, *args, **kwargs):
         component = component_cls(self, *args, **kwargs)
         if name:
             component.name = name
         self.components.append(component)
+
+        # 부모 클래스로 찾아도 나오도록 MRO의 모든 클래스에 색인 (먼저 추가된 것 우선)
+        for cls in type(component).__mro__:
+            if cls is object:
+                break
+            self._components_by_type.setdefault(cls, component)
+
+        if self._registered:
+            sys_objects.register_component(component)
         return component
 
+    def remove_component(self, component):
+        if component not in self.components:
+            return
+        self.components.remove(component)
+
+        for cls in type(component).__mro__:
+            if self._components_by_type.get(cls) is component:
+                # 같은 타입의 다른 컴포넌트가 있으면 그것으로 대체
+                replacement = None
+                for c in self.components:
+                    if isinstance(c, cls):
+                        replacement = c
+                        break
+                if replacement:
+                    self._components_by_type[cls] = replacement
+                else:
+                    del self._components_by_type[cls]
+
+        if self._registered:
+            sys_objects.unregister_component(component)
+
     def get_component(self, name):
         for c in self.components:
             if c.name == name:
@@ -24,14 +161,46 @@ class GameObject:
         return None
 
     def get_component_by_type(self, component_cls):
+        return self._components_by_type.get(component_cls)
+
+    def get_half_extents(self):
+        """컬링용 경계의 반폭/반높이: 컴포넌트가 알려준 값 중 가장 큰 것, 없으면 scale 기준"""
+        hw = self.scale[0] / 2
+        hh = self.scale[1] / 2
         for c in self.components:
-            if isinstance(c, component_cls):
-                return c
-        return None
+            extents = c.get_half_extents()
+            if extents:
+                hw = max(hw, extents[0])
+                hh = max(hh, extents[1])
+        return hw, hh
+
+    # --- 풀링 (object_pool.ObjectPool) ---
+    def on_acquire(self, x=0, y=0, rotation=0.0):
+        """풀에서 꺼낼 때 호출되는 초기화 훅. 추가 상태가 있는 프리팹은 재정의 후 super() 호출"""
+        self.position = (x, y)
+        self.rotation = rotation
+        self.reset_interpolation()
+        for component in self.components:
+            component.on_acquire()
+
+    def on_release(self):
+        """풀에 반납될 때 호출"""
+        for component in self.components:
+            component.on_release()
+
+    def destroy(self):
+        """풀에서 온 오브젝트면 풀로 반납(비활성화), 아니면 ObjectManager에서 제거"""
+        if self._pool is not None:
+            self._pool.release(self)
+        else:
+            sys_objects.remove(self)
 
     def update(self, dt):
+        # 시스템 업데이트 모드에서는 ObjectManager가 컴포넌트를 타입별로 이미 갱신함
+        if sys_objects.system_update:
+            return
         for component in self.components:
-            if component.active:
+            if component.active and not component.batched_update:
                 component.update(dt)
 
     def render(self):
@@ -1,8 +1,131 @@
 # graphic_sys.py
+import time
 import moderngl
 import numpy as np
 from settings import *
 import camera
+from transform import write_transformation_matrix
+from render_queue import RenderQueue, KIND_CALLBACK
+
+
+class RenderContext:
+    """프레임 단위 렌더링 상태: 카메라 뷰-투영 행렬을 공유 UBO로 한 번만 올립니다."""
+    BINDING = 0  # 모든 프로그램의 CameraBlock이 읽는 바인딩 번호
+
+    def __init__(self, ctx):
+        self.ubo = ctx.buffer(reserve=64)  # mat4 1개 (std140)
+        self.ubo.bind_to_uniform_block(self.BINDING)
+        self.camera = None
+        self.uploaded_version = -1
+        self.frame_index = 0
+        self.upload_identity()
+
+    def upload_identity(self):
+        self.ubo.write(np.identity(4, dtype='f4').tobytes())
+
+    def begin_frame(self, cam):
+        self.frame_index += 1
+        if cam is None:
+            if self.camera is not None:
+                self.camera = None
+                self.upload_identity()
+            return
+
+        # 카메라가 더러울 때만 행렬을 다시 계산하고, 바뀐 경우에만 업로드
+        vp_matrix = cam.get_view_projection_matrix()
+        if cam is not self.camera or cam.version != self.uploaded_version:
+            self.ubo.write(vp_matrix.tobytes())
+            self.camera = cam
+            self.uploaded_version = cam.version
+
+
+class RenderTarget:
+    """장면을 낮은 내부 해상도의 오프스크린 프레임버퍼에 그린 뒤 NEAREST로 확대해 화면에 올립니다.
+
+    프레임버퍼는 최대 내부 해상도로 한 번만 만들고, 동적 해상도는 그 안의 뷰포트 크기만 바꿉니다.
+    투영 행렬은 뷰포트와 무관하므로 해상도가 바뀌어도 보이는 월드 영역은 같습니다.
+    """
+    def __init__(self, ctx, quad_vbo, size, levels):
+        self.ctx = ctx
+        self.size = size  # 최대 내부 해상도
+        self.color = ctx.texture(size, 4)
+        self.color.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        self.fbo = ctx.framebuffer(color_attachments=[self.color])
+
+        # 동적 해상도 단계 (최대 해상도 대비 비율, 큰 것부터)
+        self.levels = sorted(levels, reverse=True)
+        self.level = 0
+        self.render_size = size
+        self.frame_ms = None     # 지수 평균한 프레임 시간
+        self.cooldown = 0        # 해상도를 바꾼 뒤 다시 바꾸기까지 기다릴 프레임 수
+        self.resolution_changes = 0
+
+        self.prog = ctx.program(
+            vertex_shader="""
+            #version 330
+            in vec2 in_vert;
+            in vec2 in_uv;
+            out vec2 v_uv;
+            uniform vec2 u_uv_scale;  // 최대 크기 프레임버퍼 중 실제로 그린 영역의 비율
+
+            void main() {
+                // 기본 쿼드는 이미지 기준 UV(위가 v=0)이고, 프레임버퍼는 아래가 v=0이므로 뒤집음
+                v_uv = vec2(in_uv.x, 1.0 - in_uv.y) * u_uv_scale;
+                gl_Position = vec4(in_vert * 2.0, 0.0, 1.0);
+            }
+            """,
+            fragment_shader="""
+            #version 330
+            in vec2 v_uv;
+            out vec4 f_color;
+            uniform sampler2D u_texture;
+
+            void main() {
+                f_color = vec4(texture(u_texture, v_uv).rgb, 1.0);
+            }
+            """
+        )
+        self.vao = ctx.vertex_array(self.prog, [(quad_vbo, '2f 2f', 'in_vert', 'in_uv')])
+
+    def set_level(self, level):
+        self.level = min(max(level, 0), len(self.levels) - 1)
+        ratio = self.levels[self.level]
+        self.render_size = (max(1, int(self.size[0] * ratio)), max(1, int(self.size[1] * ratio)))
+
+    def begin(self):
+        self.fbo.use()
+        self.fbo.viewport = (0, 0) + self.render_size
+
+    def present(self, output, output_size, unit=0):
+        """그린 영역을 출력 대상(화면 또는 헤드리스 프레임버퍼) 전체로 확대"""
+        output.use()
+        output.viewport = (0, 0) + tuple(output_size)
+        self.prog['u_uv_scale'].value = (self.render_size[0] / self.size[0], self.render_size[1] / self.size[1])
+        self.prog['u_texture'].value = unit
+        self.color.use(location=unit)
+        self.ctx.disable(moderngl.BLEND)  # 배경까지 그대로 덮어씀 (화면을 따로 지울 필요 없음)
+        self.vao.render(moderngl.TRIANGLE_STRIP)
+        self.ctx.enable(moderngl.BLEND)
+
+    def adapt(self, frame_ms, target_ms):
+        """측정한 프레임 시간이 목표보다 길면 해상도를 한 단계 낮추고, 충분히 짧으면 올립니다."""
+        if frame_ms is None:
+            return
+        self.frame_ms = frame_ms if self.frame_ms is None else self.frame_ms * 0.9 + frame_ms * 0.1
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+
+        level = self.level
+        if self.frame_ms > target_ms and level < len(self.levels) - 1:
+            level += 1
+        elif self.frame_ms < target_ms * DYNAMIC_RESOLUTION_HEADROOM and level > 0:
+            level -= 1
+        if level != self.level:
+            self.set_level(level)
+            self.frame_ms = None
+            self.cooldown = DYNAMIC_RESOLUTION_COOLDOWN
+            self.resolution_changes += 1
 
 
 class GraphicsEngine:
@@ -11,9 +134,57 @@ class GraphicsEngine:
         self.prog = None
         self.vbo = None
         self.vao = None
+        self.render_context = None
+        self.offscreen_fbo = None  # 헤드리스 모드에서 그리는 대상
+        self.screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # 프레임 통계: stats는 그리는 중인 프레임(begin_frame에서 초기화),
+        # frame_stats는 end_frame에서 복사한 직전 완료 프레임
+        self.stats = {'draw_calls': 0, 'sprites': 0, 'vertices': 0, 'texture_binds': 0, 'uniform_writes': 0,
+                      'texture_binds_skipped': 0, 'uniform_writes_skipped': 0}
+        self.frame_stats = dict(self.stats)
+
+        # GPU 시간: 타이머 쿼리를 링으로 돌려서 GPU_QUERY_LATENCY 프레임 뒤에 읽음 (파이프라인 대기 없음)
+        self.gpu_timing = GPU_TIMER_QUERIES
+        self.gpu_queries = []
+        self.gpu_query_frames = []  # 쿼리마다 측정한 프레임 번호 (-1: 비어 있음)
+        self.active_query = None
+        self.gpu_time_ms = None     # 가장 최근에 읽어 온 GPU 시간
+        self.gpu_time_frame = -1    # 그 값이 측정된 프레임 번호
+
+        self.overlay = None
+        self.overlay_enabled = STATS_OVERLAY
+
+        # 낮은 내부 해상도 렌더 타깃 (None이면 출력 대상에 바로 그림)
+        self.render_target = None
+        self.dynamic_resolution = DYNAMIC_RESOLUTION
+        self._last_frame_time = None
 
-    def initialize(self):
-        self.ctx = moderngl.create_context()
+        # 인스턴싱(배치) 렌더링용
+        self.batch_mode = BATCH_RENDERING
+        self.prog_instanced = None
+        self.instance_vbo = None
+        self.instance_vao = None
+        self.queue = RenderQueue()  # 렌더 패스 동안 제출된 명령 (프레임당 한 번 정렬)
+        self._model_matrix = np.identity(4, dtype='f4')  # 단발성 드로우용 버퍼
+
+        # 아틀라스 통계: 이번 프레임에 그려진 시트(TextureRegion)와 절약된 바인딩 수
+        self.frame_sheets = set()
+        self.texture_binds_saved = 0
+
+        # GL 상태 그림자 사본: 이미 같은 값이면 바인딩/uniform 쓰기를 건너뜀
+        self._bound_textures = {}   # Key: 텍스처 유닛, Value: 텍스처
+        self._uniform_handles = {}  # Key: 프로그램 glo, Value: {이름: Uniform} (프로그램 생성 시 한 번 조회)
+        self._uniform_values = {}   # Key: 프로그램 glo, Value: {이름: 마지막으로 쓴 값}
+
+    def initialize(self, headless=False, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """headless=True 이면 창 없이 독립(오프스크린) 컨텍스트를 만들고 프레임버퍼에 그립니다."""
+        if headless:
+            self.ctx = self._create_standalone_context()
+            self.offscreen_fbo = self.ctx.simple_framebuffer(size)
+            self.offscreen_fbo.use()
+        else:
+            self.ctx = moderngl.create_context()
         self.ctx.enable(moderngl.BLEND)
         self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
 
@@ -26,7 +197,26 @@ class GraphicsEngine:
         ], dtype='f4')
 
         self.vbo = self.ctx.buffer(vertices.tobytes())
+        self.render_context = RenderContext(self.ctx)
         self._load_shaders()
+        self._load_instanced_shaders()
+
+        if self.gpu_timing:
+            self.gpu_queries = [self.ctx.query(time=True) for _ in range(GPU_QUERY_LATENCY + 1)]
+            self.gpu_query_frames = [-1] * len(self.gpu_queries)
+        self.screen_size = size
+
+        if OFFSCREEN_RENDERING:
+            self.render_target = RenderTarget(self.ctx, self.vbo, (INTERNAL_WIDTH, INTERNAL_HEIGHT),
+                                              DYNAMIC_RESOLUTION_LEVELS)
+
+    @staticmethod
+    def _create_standalone_context():
+        # 기본 백엔드(X11/WGL/CGL)가 안 되면 EGL(소프트웨어 래스터라이저 포함)로 시도
+        try:
+            return moderngl.create_standalone_context()
+        except Exception:
+            return moderngl.create_standalone_context(backend='egl')
 
     def _load_shaders(self):
         self.prog = self.ctx.program(
@@ -36,8 +226,10 @@ class GraphicsEngine:
             in vec2 in_uv;
             out vec2 v_uv;
 
-            // [변경] 개별 위치값 대신 행렬을 받습니다.
-            uniform mat4 u_view_projection; // 카메라 + 투영 행렬
+            // 카메라 + 투영 행렬은 프레임마다 한 번 올라가는 공유 UBO에서 읽습니다.
+            layout(std140) uniform CameraBlock {
+                mat4 u_view_projection;
+            };
             uniform mat4 u_model;           // 오브젝트 월드 행렬
 
             uniform vec2 u_uv_offset;
@@ -64,29 +256,291 @@ class GraphicsEngine:
             }
             """
         )
+        self.prog['CameraBlock'].binding = RenderContext.BINDING
+        # 매 드로우 같은 값이던 상수는 여기서 한 번만 씀
+        self.register_program(self.prog, {'u_texture': 0, 'u_alpha_threshold': 0.1})
+        self._u_model = self.uniform_handle(self.prog, 'u_model')
         self.vao = self.ctx.vertex_array(self.prog, [
             (self.vbo, '2f 2f', 'in_vert', 'in_uv')
         ])
 
-    def render_sprite(self, texture, model_matrix, view_proj_matrix, uv_offset=(0, 0), uv_scale=(1, 1)):
-        texture.use(location=0)
+    def _load_instanced_shaders(self):
+        # 배치 모드용: 스프라이트별 값은 uniform 대신 인스턴스 속성으로 받습니다.
+        self.prog_instanced = self.ctx.program(
+            vertex_shader="""
+            #version 330
+            in vec2 in_vert;
+            in vec2 in_uv;
 
-        vp_matrix = np.identity(4, dtype='f4')
+            // 인스턴스(스프라이트)마다 하나씩 넘어오는 값
+            // 모델 행렬 대신 2x3 아핀 행렬의 두 행만 받습니다.
+            in vec3 in_affine_x;
+            in vec3 in_affine_y;
+            in vec2 in_uv_offset;
+            in vec2 in_uv_scale;
 
-        # 현재 활성화된 카메라가 있을 때만 행렬을 가져옴
-        if camera.active_camera:
-            vp_matrix = camera.active_camera.get_view_projection_matrix()
-            # 셰이더에 전달
-            self.prog['u_view_projection'].write(vp_matrix.tobytes())
+            out vec2 v_uv;
 
-        self.prog['u_model'].write(model_matrix.tobytes())
+            layout(std140) uniform CameraBlock {
+                mat4 u_view_projection;
+            };
 
-        self.prog['u_texture'].value = 0
-        self.prog['u_alpha_threshold'].value = 0.1
-        self.prog['u_uv_offset'].value = uv_offset
-        self.prog['u_uv_scale'].value = uv_scale
+            void main() {
+                v_uv = in_uv * in_uv_scale + in_uv_offset;
+                vec3 local = vec3(in_vert, 1.0);
+                vec2 world = vec2(dot(in_affine_x, local), dot(in_affine_y, local));
+                gl_Position = u_view_projection * vec4(world, 0.0, 1.0);
+            }
+            """,
+            fragment_shader="""
+            #version 330
+            in vec2 v_uv;
+            out vec4 f_color;
+            uniform sampler2D u_texture;
+            uniform float u_alpha_threshold;
+
+            void main() {
+                vec4 tex_color = texture(u_texture, v_uv);
+                if (tex_color.a < u_alpha_threshold) discard;
+                f_color = tex_color;
+            }
+            """
+        )
+        self.prog_instanced['CameraBlock'].binding = RenderContext.BINDING
+        self.register_program(self.prog_instanced, {'u_texture': 0, 'u_alpha_threshold': 0.1})
+
+        # 인스턴스 버퍼는 필요할 때 orphan으로 키워서 VAO를 다시 만들지 않습니다.
+        self.instance_vbo = self.ctx.buffer(reserve=256 * RenderQueue.FLOATS_PER_INSTANCE * 4)
+        self.instance_vao = self.ctx.vertex_array(self.prog_instanced, [
+            (self.vbo, '2f 2f', 'in_vert', 'in_uv'),
+            (self.instance_vbo, '3f 3f 2f 2f/i', 'in_affine_x', 'in_affine_y', 'in_uv_offset', 'in_uv_scale'),
+        ])
+
+    def _resolve_texture(self, texture, uv_offset, uv_scale):
+        """TextureRegion(아틀라스 영역)이면 실제 GL 텍스처와 변환된 UV를 돌려줍니다."""
+        if isinstance(texture, moderngl.Texture):
+            return texture, uv_offset, uv_scale
+
+        self.frame_sheets.add(texture)
+        uv_offset, uv_scale = texture.map_uv(uv_offset, uv_scale)
+        return texture.texture, uv_offset, uv_scale
+
+    # --- GL 상태 캐시 ---
+    def register_program(self, prog, constants=None):
+        """프로그램의 uniform 핸들을 한 번만 조회해 두고, 상수 uniform은 여기서 한 번만 씁니다.
+        (다른 모듈이 만든 프로그램도 set_uniform을 쓰려면 먼저 등록)"""
+        self._uniform_handles[prog.glo] = {
+            name: prog[name] for name in prog if isinstance(prog[name], moderngl.Uniform)
+        }
+        self._uniform_values[prog.glo] = {}
+        for name, value in (constants or {}).items():
+            self.set_uniform(prog, name, value)
+
+    def uniform_handle(self, prog, name):
+        return self._uniform_handles[prog.glo][name]
+
+    def bind_texture(self, texture, location=0):
+        """이미 바인딩된 텍스처면 건너뜁니다. 실제로 바인딩했으면 True"""
+        if self._bound_textures.get(location) is texture:
+            self.stats['texture_binds_skipped'] += 1
+            return False
+        texture.use(location=location)
+        self._bound_textures[location] = texture
+        self.stats['texture_binds'] += 1
+        return True
+
+    def set_uniform(self, prog, name, value):
+        """마지막으로 쓴 값과 같으면 건너뜁니다."""
+        values = self._uniform_values[prog.glo]
+        if values.get(name) == value:
+            self.stats['uniform_writes_skipped'] += 1
+            return
+        self._uniform_handles[prog.glo][name].value = value
+        values[name] = value
+        self.stats['uniform_writes'] += 1
+
+    def record_draw(self, vertices, instances=1):
+        """렌더 큐 밖에서 직접 그리는 코드(콜백 등)가 통계에 드로우를 보고할 때 사용"""
+        self.stats['draw_calls'] += 1
+        self.stats['vertices'] += vertices * instances
+
+    def invalidate_state(self, uniforms=False):
+        """외부 코드가 GL 상태를 직접 바꿨을 수 있을 때 캐시를 비웁니다.
+
+        uniform 값은 프로그램 객체에 남아 있으므로, 우리 프로그램에 직접 쓴 코드가 있을 때만 uniforms=True
+        """
+        self._bound_textures.clear()
+        if uniforms:
+            for values in self._uniform_values.values():
+                values.clear()
+
+    # --- 렌더 큐 ---
+    def submit_sprite(self, texture, x, y, width, height, rotation=0, uv_offset=(0, 0), uv_scale=(1, 1),
+                      layer=0, depth=0, order=0):
+        """렌더 큐에 스프라이트를 제출합니다. 실제 드로우는 flush에서 정렬 후 이루어집니다.
+        order: 레이어/깊이 등이 같을 때의 그리는 순서 (SpriteRenderer는 오브젝트 생성 순서를 넘김)"""
+        texture, uv_offset, uv_scale = self._resolve_texture(texture, uv_offset, uv_scale)
+        program = self.prog_instanced if self.batch_mode else self.prog
+        self.queue.submit_sprite(layer, program.glo, texture, depth,
+                                 x, y, width, height, rotation, uv_offset, uv_scale, order)
+
+    def submit_callback(self, callback, layer=0, program=None, texture=None, depth=0, order=0):
+        """스프라이트가 아닌 드로우를 정렬된 순서에 끼워 넣습니다."""
+        self.queue.submit_callback(
+            layer,
+            program.glo if program else 0,
+            texture.glo if texture else 0,
+            depth,
+            callback,
+            order
+        )
+
+    def flush(self):
+        """렌더 큐를 (레이어, 프로그램, 텍스처, 깊이) 순으로 정렬해서 그립니다.
+        배치 모드면 같은 텍스처 구간마다 인스턴스 드로우 한 번입니다."""
+        queue = self.queue
+        if len(queue) == 0:
+            return
+
+        order = queue.sort()
+        instances = queue.build_instances() if self.batch_mode else None
+        self.stats['sprites'] += len(queue.sprite_records)
+
+        binds = 0
+        for kind, texture, idx in queue.runs(order):
+            if kind == KIND_CALLBACK:
+                for i in idx:
+                    queue.commands[i][2]()
+                # 콜백이 GL 상태를 바꿨을 수 있음
+                self.invalidate_state()
+                continue
+
+            if self.bind_texture(texture):
+                binds += 1
+            sprite_idx = queue.sprite_indices(idx)
+
+            if self.batch_mode:
+                data = instances[sprite_idx]
+                if data.nbytes > self.instance_vbo.size:
+                    self.instance_vbo.orphan(data.nbytes * 2)
+                self.instance_vbo.write(data.tobytes())
+                self.instance_vao.render(moderngl.TRIANGLE_STRIP, instances=len(data))
+                self.record_draw(4, len(data))
+            else:
+                for i in sprite_idx.tolist():
+                    x, y, w, h, rot, u, v, su, sv = queue.sprite_records[i]
+                    model_matrix = write_transformation_matrix(self._model_matrix, x, y, w, h, rot)
+                    self._draw_single(model_matrix, (u, v), (su, sv))
+
+        queue.clear()
+
+        # 아틀라스가 없었다면 시트마다 한 번씩 바인딩했을 것
+        self.texture_binds_saved = max(0, len(self.frame_sheets) - binds)
+
+    def render_sprite(self, texture, model_matrix, view_proj_matrix=None, uv_offset=(0, 0), uv_scale=(1, 1)):
+        """단발성 드로우: 렌더 큐를 거치지 않고 바로 그립니다."""
+        # view_proj_matrix는 하위 호환용 인자입니다.
+        # 뷰-투영 행렬은 begin_frame에서 CameraBlock UBO로 이미 올라가 있습니다.
+        texture, uv_offset, uv_scale = self._resolve_texture(texture, uv_offset, uv_scale)
+        self.bind_texture(texture)
+        self._draw_single(model_matrix, uv_offset, uv_scale)
+
+    def _draw_single(self, model_matrix, uv_offset, uv_scale):
+        # 모델 행렬은 드로우마다 다르므로 비교 없이 바로 씀
+        self._u_model.write(model_matrix.tobytes())
+        self.stats['uniform_writes'] += 1
+
+        self.set_uniform(self.prog, 'u_uv_offset', tuple(uv_offset))
+        self.set_uniform(self.prog, 'u_uv_scale', tuple(uv_scale))
 
         self.vao.render(moderngl.TRIANGLE_STRIP)
+        self.record_draw(4)
+
+    def begin_frame(self):
+        """프레임 시작: 화면을 지우고 카메라 UBO를 갱신합니다."""
+        for key in self.stats:
+            self.stats[key] = 0
+        self._begin_gpu_query()
+
+        if self.render_target is not None:
+            if self.dynamic_resolution:
+                self._adapt_resolution()
+            self.render_target.begin()
+        self.clear()
+        self.render_context.begin_frame(camera.active_camera)
+        self.frame_sheets.clear()
+        self.invalidate_state()
+
+    def end_frame(self):
+        """프레임 끝 (flush 다음, 화면 전환 전): 내부 해상도로 그린 장면을 화면에 확대해 올리고,
+        통계를 확정하고 GPU 타이머를 닫습니다."""
+        if self.render_target is not None:
+            self.render_target.present(self.get_output(), self.screen_size)
+            self.invalidate_state()  # 텍스처 유닛 0을 바꿈
+
+        if self.overlay_enabled:
+            self._draw_overlay()
+
+        if self.active_query is not None:
+            self.active_query.__exit__()
+            self.active_query = None
+        self.frame_stats = dict(self.stats)
+
+    def _begin_gpu_query(self):
+        if not self.gpu_queries:
+            return
+        if self.active_query is not None:
+            # end_frame 없이 다음 프레임이 시작된 경우 열린 쿼리를 먼저 닫음
+            self.active_query.__exit__()
+            self.active_query = None
+        frame = self.render_context.frame_index + 1  # 이번 begin_frame에서 증가할 번호
+        slot = frame % len(self.gpu_queries)
+
+        # 같은 쿼리를 다시 쓰기 전에, 그것이 측정했던 (GPU_QUERY_LATENCY 프레임 전) 결과를 읽음
+        query = self.gpu_queries[slot]
+        if self.gpu_query_frames[slot] >= 0:
+            self.gpu_time_ms = query.elapsed / 1e6  # 나노초 -> 밀리초
+            self.gpu_time_frame = self.gpu_query_frames[slot]
+
+        self.gpu_query_frames[slot] = frame
+        self.active_query = query.__enter__()
+
+    def get_stats(self):
+        """직전 완료 프레임의 통계 + 가장 최근에 읽어 온 GPU 시간 (몇 프레임 늦음)"""
+        stats = dict(self.frame_stats)
+        stats['gpu_ms'] = self.gpu_time_ms
+        stats['gpu_frame'] = self.gpu_time_frame
+        stats['frame'] = self.render_context.frame_index
+        stats['render_size'] = self.render_target.render_size if self.render_target else self.screen_size
+        return stats
+
+    def get_output(self):
+        """최종 출력 대상: 헤드리스면 오프스크린 프레임버퍼, 아니면 창의 기본 프레임버퍼"""
+        return self.offscreen_fbo if self.offscreen_fbo is not None else self.ctx.screen
+
+    def set_resolution_level(self, level):
+        """내부 해상도 단계를 직접 지정 (0 = 최대, DYNAMIC_RESOLUTION_LEVELS 순서)"""
+        if self.render_target is not None:
+            self.render_target.set_level(level)
+
+    def _adapt_resolution(self):
+        # GPU 시간이 있으면 그것으로(해상도가 직접 영향), 없으면 프레임 간격으로 판단
+        now = time.perf_counter()
+        frame_ms = self.gpu_time_ms
+        if frame_ms is None and self._last_frame_time is not None:
+            frame_ms = (now - self._last_frame_time) * 1000.0
+        self._last_frame_time = now
+        self.render_target.adapt(frame_ms, DYNAMIC_RESOLUTION_TARGET_MS)
+
+    def toggle_overlay(self):
+        self.overlay_enabled = not self.overlay_enabled
+
+    def _draw_overlay(self):
+        if self.overlay is None:
+            from debug_overlay import StatsOverlay  # 오버레이를 켤 때만 pygame.font 사용
+            self.overlay = StatsOverlay(self.ctx, self.vbo, self.screen_size)
+        self.overlay.draw(self.stats, self.gpu_time_ms, time.perf_counter())
+        self.invalidate_state()  # 오버레이가 텍스처 유닛 0을 바꿈
 
     def clear(self):
         self.ctx.clear(*CLEAR_COLOR)
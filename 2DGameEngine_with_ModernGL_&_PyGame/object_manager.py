@@ -1,33 +1,438 @@
 # object_manager.py
+import numpy as np
+from settings import TRANSFORM_SOA, SYSTEM_UPDATE, FRUSTUM_CULLING, SPATIAL_CELL_SIZE
+from component import Component
+from transform import create_transformation_matrices
+from spatial_grid import SpatialGrid
+from animation_sys import sys_animation
+from profiler import sys_profiler
+from object_pool import sys_pools
+
+# 지연 명령 종류 (update_all 도중 요청된 변경은 갱신이 끝난 뒤 순서대로 적용)
+CMD_SPAWN = 0
+CMD_DESPAWN = 1
+CMD_ACTIVE = 2
+
+
+class Vec2Proxy:
+    """TransformStorage 배열의 한 행을 리스트처럼 다루게 해주는 프록시
+
+    배열이 커지면서 재할당되어도 안전하도록 뷰 대신 (저장소, 필드, 슬롯)을 들고 있습니다.
+    """
+    __slots__ = ('_storage', '_field', '_slot')
+
+    def __init__(self, storage, field, slot):
+        self._storage = storage
+        self._field = field
+        self._slot = slot
+
+    def __getitem__(self, i):
+        return getattr(self._storage, self._field)[self._slot, i]
+
+    def __setitem__(self, i, value):
+        getattr(self._storage, self._field)[self._slot, i] = value
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        row = getattr(self._storage, self._field)[self._slot]
+        return iter((row[0], row[1]))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def tolist(self):
+        return [float(v) for v in self]
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+
+class TransformStorage:
+    """GameObject 트랜스폼을 연속된 NumPy 배열로 보관 (Structure of Arrays)
+
+    슬롯 번호는 오브젝트가 등록되어 있는 동안 바뀌지 않습니다.
+    """
+    def __init__(self, capacity=256):
+        self.positions = np.zeros((capacity, 2), dtype='f8')
+        # 고정 스텝 보간용: 직전 틱의 위치와 이번 프레임에 그릴 위치
+        self.prev_positions = np.zeros((capacity, 2), dtype='f8')
+        self.render_positions = np.zeros((capacity, 2), dtype='f8')
+        self.scales = np.zeros((capacity, 2), dtype='f8')
+        self.rotations = np.zeros(capacity, dtype='f8')
+        self.prev_rotations = np.zeros(capacity, dtype='f8')
+        self.render_rotations = np.zeros(capacity, dtype='f8')
+        self.active = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)  # 슬롯 사용 여부
+        self.owners = [None] * capacity
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+    @property
+    def capacity(self):
+        return len(self.owners)
+
+    def _grow(self):
+        old = self.capacity
+        new = old * 2
+        for field in ('positions', 'prev_positions', 'render_positions', 'scales',
+                      'rotations', 'prev_rotations', 'render_rotations', 'active', 'alive'):
+            arr = getattr(self, field)
+            grown = np.zeros((new,) + arr.shape[1:], dtype=arr.dtype)
+            grown[:old] = arr
+            setattr(self, field, grown)
+        self.owners.extend([None] * (new - old))
+        self.free_slots.extend(range(new - 1, old - 1, -1))
+
+    def attach(self, obj):
+        """오브젝트의 현재 값을 배열로 옮기고, position/scale을 프록시로 바꿉니다."""
+        if not self.free_slots:
+            self._grow()
+        slot = self.free_slots.pop()
+
+        self.positions[slot] = (obj._position[0], obj._position[1])
+        self.prev_positions[slot] = self.positions[slot]
+        self.render_positions[slot] = self.positions[slot]
+        self.scales[slot] = (obj._scale[0], obj._scale[1])
+        self.rotations[slot] = obj._rotation
+        self.prev_rotations[slot] = obj._rotation
+        self.render_rotations[slot] = obj._rotation
+        self.active[slot] = obj._active
+        self.alive[slot] = True
+        self.owners[slot] = obj
+
+        obj._transforms = self
+        obj._transform_slot = slot
+        obj._position = Vec2Proxy(self, 'positions', slot)
+        obj._scale = Vec2Proxy(self, 'scales', slot)
+
+    def detach(self, obj):
+        """배열의 값을 다시 오브젝트의 리스트로 돌려주고 슬롯을 반납합니다."""
+        slot = obj._transform_slot
+        obj._position = [float(self.positions[slot, 0]), float(self.positions[slot, 1])]
+        obj._prev_position = [float(self.prev_positions[slot, 0]), float(self.prev_positions[slot, 1])]
+        obj._scale = [float(self.scales[slot, 0]), float(self.scales[slot, 1])]
+        obj._rotation = float(self.rotations[slot])
+        obj._prev_rotation = float(self.prev_rotations[slot])
+        obj._active = bool(self.active[slot])
+        obj._transforms = None
+        obj._transform_slot = None
+
+        self.alive[slot] = False
+        self.active[slot] = False
+        self.owners[slot] = None
+        self.free_slots.append(slot)
+
+    def store_previous(self):
+        np.copyto(self.prev_positions, self.positions)
+        np.copyto(self.prev_rotations, self.rotations)
+
+    def interpolate(self, alpha):
+        """render = prev + (현재 - prev) * alpha 를 전체 슬롯에 한 번에 계산"""
+        np.subtract(self.positions, self.prev_positions, out=self.render_positions)
+        self.render_positions *= alpha
+        self.render_positions += self.prev_positions
+
+        # 회전은 짧은 쪽으로 보간 (-pi ~ pi 로 감싼 차이)
+        np.subtract(self.rotations, self.prev_rotations, out=self.render_rotations)
+        self.render_rotations += np.pi
+        np.mod(self.render_rotations, 2 * np.pi, out=self.render_rotations)
+        self.render_rotations -= np.pi
+        self.render_rotations *= alpha
+        self.render_rotations += self.prev_rotations
+
+    def live_slots(self, active_only=True):
+        mask = self.active if active_only else self.alive
+        return np.flatnonzero(mask)
+
+    def query_rect(self, left, bottom, right, top, slots=None):
+        """위치가 사각형 안에 있는 슬롯 번호들 (배열 연산)"""
+        if slots is None:
+            slots = self.live_slots()
+        pos = self.positions[slots]
+        inside = ((pos[:, 0] >= left) & (pos[:, 0] <= right) &
+                  (pos[:, 1] >= bottom) & (pos[:, 1] <= top))
+        return slots[inside]
+
+    def sort_slots(self, slots, axis=1, descending=False):
+        """슬롯을 x(axis=0) 또는 y(axis=1) 좌표 순으로 정렬"""
+        order = np.argsort(self.positions[slots, axis], kind='stable')
+        if descending:
+            order = order[::-1]
+        return slots[order]
+
+    def build_matrices(self, slots, compact=True):
+        """슬롯들의 모델 행렬을 한 번에 생성"""
+        pos = self.positions[slots]
+        scale = self.scales[slots]
+        return create_transformation_matrices(
+            pos[:, 0], pos[:, 1], scale[:, 0], scale[:, 1], self.rotations[slots], compact=compact
+        )
+
+    def clear(self):
+        for obj in self.owners:
+            if obj is not None:
+                self.detach(obj)
+
 
 class ObjectManager:
     def __init__(self):
-        self.objects = {}  # Key: name, Value: List[GameObject]
+        # Key: name, Value: List[GameObject] - 오브젝트가 자기 인덱스를 알고 있어 swap-remove로 O(1) 제거
+        self.objects = {}
+        # 활성 오브젝트만 모은 집합 (순서 있는 dict) - 비활성 오브젝트는 순회 자체에서 빠짐
+        self.active_objects = {}  # Key: name, Value: dict(obj -> None)
+
+        # update_all 도중의 생성/제거/활성 변경은 여기에 모았다가 갱신이 끝난 뒤 적용
+        self.updating = False
+        self.pending = []  # (명령 종류, 오브젝트)
+        self._spawn_counter = 0  # 그리는 순서를 등록 순서로 유지하기 위한 번호
+        # 선택적 SoA 백엔드 (None이면 각 오브젝트가 리스트로 트랜스폼을 보관)
+        self.transforms = TransformStorage() if TRANSFORM_SOA else None
+
+        # 컴포넌트 레지스트리: 살아있는 컴포넌트를 구체 타입별로 색인
+        self.components_by_type = {}  # Key: 컴포넌트 클래스, Value: List[Component]
+        self.system_order = []        # 업데이트할 타입 순서 (update_order 기준)
+        self.system_update = SYSTEM_UPDATE
+
+        # 카메라 컬링용 균일 격자
+        self.culling = FRUSTUM_CULLING
+        self.spatial_grid = SpatialGrid(SPATIAL_CELL_SIZE)
+        # total은 활성 오브젝트 수 (drawn + culled), 비활성(풀에 반납된 것 등)은 inactive로 따로 셈
+        self.render_stats = {'drawn': 0, 'culled': 0, 'total': 0, 'inactive': 0}
+
+        # 고정 스텝 렌더 보간 비율 (None이면 보간하지 않고 현재 위치를 그대로 그림)
+        self.interpolation_alpha = None
 
     def add(self, obj):
-        if obj.name not in self.objects:
-            self.objects[obj.name] = []
-        self.objects[obj.name].append(obj)
+        if self.updating:
+            self.pending.append((CMD_SPAWN, obj))
+            return
+        self._add_now(obj)
 
     def remove(self, obj):
-        if obj.name in self.objects:
-            if obj in self.objects[obj.name]:
-                self.objects[obj.name].remove(obj)
+        if self.updating:
+            self.pending.append((CMD_DESPAWN, obj))
+            return
+        self._remove_now(obj)
 
-    def update_all(self, dt):
-        for name, obj_list in self.objects.items():
+    def set_active(self, obj):
+        """GameObject.active가 바뀌면 호출됨: 활성 집합에 넣거나 뺌"""
+        if self.updating:
+            self.pending.append((CMD_ACTIVE, obj))
+            return
+        self._sync_active(obj)
+
+    def _add_now(self, obj):
+        if obj._registered:
+            return
+        obj_list = self.objects.get(obj.name)
+        if obj_list is None:
+            obj_list = []
+            self.objects[obj.name] = obj_list
+            self.active_objects[obj.name] = {}
+        obj._list_name = obj.name  # 등록 후 name이 바뀌어도 찾을 수 있게
+        obj._list_index = len(obj_list)
+        obj_list.append(obj)
+        obj._spawn_index = self._spawn_counter
+        self._spawn_counter += 1
+        if self.transforms is not None:
+            self.transforms.attach(obj)
+
+        obj._registered = True
+        self._sync_active(obj)
+        for component in obj.components:
+            self.register_component(component)
+        self.spatial_grid.insert(obj)
+
+    def _remove_now(self, obj):
+        if not obj._registered:
+            return  # 이미 제거됨 (중복 제거는 무시)
+        # 마지막 원소를 빈자리로 옮기는 swap-remove (O(1))
+        obj_list = self.objects[obj._list_name]
+        idx = obj._list_index
+        last = obj_list.pop()
+        if last is not obj:
+            obj_list[idx] = last
+            last._list_index = idx
+        obj._list_index = None
+        self.active_objects[obj._list_name].pop(obj, None)
+
+        self.spatial_grid.remove(obj)
+        if obj._transforms is not None:
+            obj._transforms.detach(obj)
+
+        obj._registered = False
+        for component in obj.components:
+            self.unregister_component(component)
+
+    def _sync_active(self, obj):
+        if not obj._registered:
+            return
+        active_set = self.active_objects[obj._list_name]
+        if obj.active:
+            active_set[obj] = None
+        else:
+            active_set.pop(obj, None)
+
+    def apply_pending(self):
+        """update_all 도중 쌓인 생성/제거/활성 변경을 요청 순서대로 적용"""
+        while self.pending:
+            commands = self.pending
+            self.pending = []
+            for kind, obj in commands:
+                if kind == CMD_SPAWN:
+                    self._add_now(obj)
+                elif kind == CMD_DESPAWN:
+                    self._remove_now(obj)
+                else:
+                    self._sync_active(obj)
+
+    # --- Component Registry ---
+    def register_component(self, component):
+        cls = type(component)
+        comp_list = self.components_by_type.get(cls)
+        if comp_list is None:
+            comp_list = []
+            self.components_by_type[cls] = comp_list
+            self._refresh_system_order()
+        component._registry_index = len(comp_list)
+        comp_list.append(component)
+        component.on_register()
+        # 등록 후에 붙은 컴포넌트면 컬링 경계가 커졌을 수 있음
+        self.spatial_grid.update_extent(component.game_object)
+
+    def unregister_component(self, component):
+        comp_list = self.components_by_type.get(type(component))
+        idx = component._registry_index
+        if comp_list is None or idx is None:
+            return
+        # 마지막 원소를 빈자리로 옮기는 swap-remove (O(1))
+        last = comp_list.pop()
+        if last is not component:
+            comp_list[idx] = last
+            last._registry_index = idx
+        component._registry_index = None
+        component.on_unregister()
+
+    def _refresh_system_order(self):
+        # update를 재정의하지 않았거나 배열로 한꺼번에 갱신되는 타입은 돌 필요가 없음
+        types = [cls for cls in self.components_by_type
+                 if cls.update is not Component.update and not cls.batched_update]
+        types.sort(key=lambda cls: cls.update_order)  # 안정 정렬: 같으면 등록 순
+        self.system_order = types
+
+    def get_components(self, component_cls):
+        return self.components_by_type.get(component_cls, [])
+
+    # --- 고정 스텝 보간 ---
+    def store_previous_transforms(self):
+        """고정 스텝 업데이트 직전에 호출: 현재 위치를 '이전 위치'로 저장"""
+        if self.transforms is not None:
+            self.transforms.store_previous()
+            return
+        for obj_list in self.objects.values():
             for obj in obj_list:
-                if obj.active:
-                    obj.update(dt)
+                obj._prev_position[0] = obj._position[0]
+                obj._prev_position[1] = obj._position[1]
+                obj._prev_rotation = obj._rotation
+
+    def set_interpolation(self, alpha):
+        """이번 프레임 렌더링에 쓸 보간 비율 (0: 이전 틱, 1: 현재 틱)"""
+        self.interpolation_alpha = alpha
+        if alpha is not None and self.transforms is not None:
+            self.transforms.interpolate(alpha)
+
+    def update_all(self, dt):
+        # 모든 SpriteRenderer 애니메이션 시계를 배열 연산 한 번으로 진행
+        with sys_profiler.scope("Animation"):
+            sys_animation.advance(dt)
+
+        # 갱신 도중에는 리스트/집합을 바꾸지 않고 명령만 쌓아 두었다가 끝난 뒤 적용
+        self.updating = True
+        try:
+            if self.system_update:
+                self._update_systems(dt)
+            else:
+                for name, active_set in self.active_objects.items():
+                    with sys_profiler.scope(name, "object"):
+                        for obj in active_set:
+                            obj.update(dt)
+        finally:
+            self.updating = False
+            self.apply_pending()
+
+    def _update_systems(self, dt):
+        # 1. 컴포넌트 타입별로 한 번에 (모든 SpriteRenderer -> 다음 타입 ...)
+        for cls in self.system_order:
+            with sys_profiler.scope(cls.__name__, "component"):
+                for component in self.components_by_type[cls]:
+                    if component.active and component.game_object.active:
+                        component.update(dt)
+
+        # 2. update를 재정의한 오브젝트의 자체 로직
+        for name, active_set in self.active_objects.items():
+            with sys_profiler.scope(name, "object"):
+                for obj in active_set:
+                    if obj.has_custom_update:
+                        obj.update(dt)
 
     def render_all(self):
-        for name, obj_list in self.objects.items():
-            for obj in obj_list:
-                if obj.active:
-                    obj.render()
+        # camera -> game_object -> object_manager 순환 참조를 피하려고 여기서 import
+        import camera
+        cam = camera.active_camera
+        if not self.culling or cam is None:
+            for name, active_set in self.active_objects.items():
+                with sys_profiler.scope(name, "object"):
+                    for obj in active_set:
+                        obj.render()
+            return
+
+        # 위치가 바뀐 오브젝트만 격자에서 옮긴 뒤, 카메라 영역과 겹치는 것만 그림
+        with sys_profiler.scope("Culling"):
+            # 격자와 컬링 판정은 실제로 그리는 위치(보간된 위치) 기준
+            self.spatial_grid.refresh(self.transforms, self.interpolation_alpha is not None)
+            # 그리는 순서는 렌더 큐가 정렬 키(레이어 등)와 생성 순서로 정하므로 여기서는 정렬하지 않음
+            visible = self.spatial_grid.query(*cam.get_visible_rect())
+
+        drawn = 0
+        for obj in visible:
+            if obj.active:
+                obj.render()
+                drawn += 1
+
+        total = sum(len(active_set) for active_set in self.active_objects.values())
+        self.render_stats['drawn'] = drawn
+        self.render_stats['culled'] = total - drawn
+        self.render_stats['total'] = total
+        self.render_stats['inactive'] = len(self.spatial_grid.extents) - total
+
+    def refresh_bounds(self, obj=None):
+        """스프라이트 크기가 바뀐 뒤(비동기 텍스처 업로드 완료, 스케일 변경 등) 컬링 경계를 갱신
+        obj를 주면 그 오브젝트만, 없으면 전체"""
+        if obj is None:
+            self.spatial_grid.refresh_extents()
+        else:
+            self.spatial_grid.update_extent(obj)
 
     def clear(self):
+        for obj_list in self.objects.values():
+            for obj in obj_list:
+                obj._registered = False
+                obj._list_index = None
         self.objects.clear()
+        self.active_objects.clear()
+        self.pending.clear()
+        self.spatial_grid.clear()
+        for comp_list in self.components_by_type.values():
+            for component in comp_list:
+                component._registry_index = None
+                component.on_unregister()
+        self.components_by_type.clear()
+        self.system_order = []
+        if self.transforms is not None:
+            self.transforms.clear()
+        # 풀에 남아 있는 오브젝트도 방금 등록 해제되었으므로 풀도 함께 비움
+        sys_pools.clear()
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,104 @@
+# object_pool.py
+
+
+class ObjectPool:
+    """같은 프리팹(GameObject + 컴포넌트 구성)의 인스턴스를 미리 만들어 두고 재사용합니다.
+
+    반납된 오브젝트는 ObjectManager 리스트에서 빼지 않고 비활성화만 하므로,
+    생성/삭제 때마다 생기는 할당과 리스트 제거 비용이 없습니다.
+    """
+    def __init__(self, factory, size=0, name=None):
+        self.factory = factory  # 인자 없이 새 인스턴스를 만드는 함수 (예: 클래스 자체)
+        self.name = name or getattr(factory, '__name__', 'Pool')
+        self.free = []
+        self.in_use = 0
+        self.hits = 0    # 미리 만들어 둔 인스턴스를 꺼낸 횟수
+        self.misses = 0  # 비어 있어서 새로 만든 횟수
+        self.prewarm(size)
+
+    def _create(self):
+        obj = self.factory()
+        obj._pool = self
+        return obj
+
+    def prewarm(self, count):
+        for _ in range(count):
+            obj = self._create()
+            obj.active = False
+            obj.on_release()
+            obj._in_pool = True
+            self.free.append(obj)
+
+    def acquire(self, **kwargs):
+        """오브젝트를 꺼내 on_acquire(**kwargs)로 초기화하고 활성화합니다."""
+        if self.free:
+            obj = self.free.pop()
+            self.hits += 1
+        else:
+            obj = self._create()
+            self.misses += 1
+
+        obj._in_pool = False
+        obj.on_acquire(**kwargs)
+        obj.active = True
+        self.in_use += 1
+        return obj
+
+    def release(self, obj):
+        if obj._in_pool or obj._pool is not self:
+            return  # 중복 반납은 무시
+        obj.active = False
+        obj.on_release()
+        obj._in_pool = True
+        self.free.append(obj)
+        self.in_use -= 1
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            'free': len(self.free),
+            'in_use': self.in_use,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 1.0,
+        }
+
+
+class PoolManager:
+    def __init__(self):
+        self.pools = {}  # Key: 프리팹 (팩토리 또는 이름), Value: ObjectPool
+
+    def create_pool(self, key, factory=None, size=0):
+        """key가 클래스면 factory를 생략할 수 있습니다. 이미 있으면 size만큼 더 채움"""
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = ObjectPool(factory or key, size)
+            self.pools[key] = pool
+        elif size > len(pool.free):
+            pool.prewarm(size - len(pool.free))
+        return pool
+
+    def get_pool(self, key):
+        return self.pools.get(key)
+
+    def acquire(self, key, **kwargs):
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.create_pool(key)
+        return pool.acquire(**kwargs)
+
+    def release(self, obj):
+        if obj._pool is not None:
+            obj._pool.release(obj)
+
+    def get_stats(self):
+        """풀 크기를 정할 때 참고할 풀별 통계 (miss가 많으면 더 크게)"""
+        return {pool.name: pool.get_stats() for pool in self.pools.values()}
+
+    def clear(self):
+        # ObjectManager.clear()가 호출 (등록 해제된 오브젝트를 풀에서 다시 꺼내지 않도록)
+        self.pools.clear()
+
+
+# 모듈 레벨 싱글톤 인스턴스
+sys_pools = PoolManager()
@@ -0,0 +1,147 @@
+# profiler.py
+import json
+import os
+import time
+from settings import PROFILER_ENABLED, PROFILER_CAPACITY, PROFILER_TRACE_DIR
+
+_clock = time.perf_counter
+
+
+class _Scope:
+    __slots__ = ('profiler', 'name', 'category')
+
+    def __init__(self, profiler, name, category):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.profiler.begin(self.name, self.category)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.end()
+        return False
+
+
+class _NullScope:
+    """프로파일러가 꺼져 있을 때 쓰는 빈 스코프 (아무 것도 기록하지 않음)"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class Profiler:
+    """중첩 타이밍 스코프를 고정 크기 링 버퍼에 기록하고 Chrome trace JSON으로 내보냅니다.
+
+    with sys_profiler.scope("Render"):
+        ...
+    가득 차면 가장 오래된 기록부터 덮어쓰므로 항상 최근 몇 초 분량이 남아 있습니다.
+    """
+    def __init__(self, capacity=PROFILER_CAPACITY):
+        self.enabled = PROFILER_ENABLED
+        self.capacity = capacity
+        # 링 버퍼 (필드별 리스트: 기록할 때 튜플을 만들지 않도록)
+        self.names = [None] * capacity
+        self.categories = [None] * capacity
+        self.starts = [0.0] * capacity
+        self.durations = [0.0] * capacity
+        self.depths = [0] * capacity
+        self.frames = [0] * capacity
+        self.count = 0  # 지금까지 기록된 전체 개수 (다음 쓰기 위치 = count % capacity)
+
+        self.stack = []  # 열려 있는 스코프: (이름, 분류, 시작 시각)
+        self.requested_enabled = None  # 스코프가 열려 있을 때 요청된 on/off (다음 프레임 경계에서 적용)
+        self.frame = 0
+        self.origin = _clock()
+
+    def scope(self, name, category="engine"):
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name, category)
+
+    def begin(self, name, category="engine"):
+        if not self.enabled:
+            return
+        self.stack.append((name, category, _clock()))
+
+    def end(self):
+        if not self.enabled or not self.stack:
+            return
+        name, category, start = self.stack.pop()
+        i = self.count % self.capacity
+        self.names[i] = name
+        self.categories[i] = category
+        self.starts[i] = start
+        self.durations[i] = _clock() - start
+        self.depths[i] = len(self.stack)
+        self.frames[i] = self.frame
+        self.count += 1
+
+    def next_frame(self):
+        self.frame += 1
+        if self.requested_enabled is not None:
+            self.enabled = self.requested_enabled
+            self.requested_enabled = None
+            self.stack.clear()
+
+    def set_enabled(self, enabled):
+        """프레임 도중(스코프가 열려 있을 때)이면 다음 프레임부터 적용해서 Frame 스코프가 깨지지 않게 함"""
+        if self.stack:
+            self.requested_enabled = enabled
+            return
+        self.enabled = enabled
+        self.requested_enabled = None
+
+    def clear(self):
+        self.count = 0
+        self.stack.clear()
+
+    def records(self):
+        """버퍼에 남아 있는 기록을 오래된 것부터 (이름, 분류, 시작, 길이, 깊이, 프레임)으로"""
+        n = min(self.count, self.capacity)
+        first = self.count - n
+        for k in range(first, self.count):
+            i = k % self.capacity
+            yield (self.names[i], self.categories[i], self.starts[i],
+                   self.durations[i], self.depths[i], self.frames[i])
+
+    def frame_times(self, name="Frame"):
+        """프레임 스코프 길이(ms) 목록 - 스파이크를 찾을 때 사용"""
+        return [(frame, duration * 1000.0)
+                for rec_name, _, _, duration, _, frame in self.records() if rec_name == name]
+
+    def export_chrome_trace(self, path=None):
+        """chrome://tracing 또는 Perfetto에서 열 수 있는 trace-event JSON으로 저장"""
+        if path is None:
+            os.makedirs(PROFILER_TRACE_DIR, exist_ok=True)
+            path = os.path.join(PROFILER_TRACE_DIR, time.strftime("trace_%Y%m%d_%H%M%S.json"))
+
+        events = []
+        pid = os.getpid()
+        for name, category, start, duration, depth, frame in self.records():
+            events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',  # 완료 이벤트 (시작 + 길이)
+                'ts': (start - self.origin) * 1e6,  # 마이크로초
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': 0,
+                'args': {'frame': frame, 'depth': depth},
+            })
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
+
+
+# 모듈 레벨 싱글톤 인스턴스
+sys_profiler = Profiler()
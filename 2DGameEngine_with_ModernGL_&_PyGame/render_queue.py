@@ -0,0 +1,141 @@
+# render_queue.py
+import numpy as np
+from transform import create_transformation_matrices
+
+# 정렬 키 구성 (상위 -> 하위): 레이어 8비트 | 프로그램 7비트 + 종류 1비트 | 텍스처 16비트 | 깊이 16비트
+# 프로그램/텍스처는 GL 객체 번호(glo)를 그대로 쓰지 않고 처음 제출될 때 붙인 작은 번호를 씀
+LAYER_SHIFT = 40
+PROGRAM_SHIFT = 32
+TEXTURE_SHIFT = 16
+KEY_BITS = 48
+DEPTH_BITS = 16
+MAX_PROGRAMS = 1 << 7
+MAX_TEXTURES = 1 << 16
+
+KIND_SPRITE = 0
+KIND_CALLBACK = 1
+
+
+def radix_argsort(keys, key_bits=KEY_BITS, digit_bits=16, order=None):
+    """LSD 기수 정렬: 하위 16비트 자리부터 안정 정렬을 반복 (같은 키는 order의 순서 유지)
+
+    uint16 자리에 대한 stable argsort는 NumPy 내부에서 기수(radix) 정렬로 처리됩니다.
+    order를 주지 않으면 같은 키는 제출 순서를 유지합니다.
+    """
+    if order is None:
+        order = np.arange(len(keys))
+    mask = np.uint64((1 << digit_bits) - 1)
+    for shift in range(0, key_bits, digit_bits):
+        digits = ((keys[order] >> np.uint64(shift)) & mask).astype(np.uint16)
+        order = order[np.argsort(digits, kind='stable')]
+    return order
+
+
+class RenderQueue:
+    """렌더 패스 동안 제출된 드로우 명령을 모아 프레임당 한 번 정렬합니다.
+
+    정렬 순서는 레이어 -> 프로그램 -> 텍스처 -> 깊이 이므로,
+    겹치는 순서가 중요한 스프라이트는 레이어로 구분해야 합니다.
+    """
+    FLOATS_PER_INSTANCE = 10  # 2x3 아핀 행렬(6) + UV 오프셋(2) + UV 스케일(2)
+
+    def __init__(self):
+        self.keys = []
+        self.commands = []  # (종류, 텍스처, 콜백) - 스프라이트면 콜백은 None
+        self.payloads = []  # 스프라이트면 sprite_records 인덱스
+        # 키가 같을 때의 순서 (보통 오브젝트 생성 순서) - 컬링 결과 순서가 바뀌어도 겹침 순서가 흔들리지 않게
+        self.orders = []
+        # 스프라이트 레코드: x, y, 크기 x, 크기 y, 회전, UV 오프셋(2), UV 스케일(2)
+        self.sprite_records = []
+        self.instance_data = np.empty((256, self.FLOATS_PER_INSTANCE), dtype='f4')
+        # GL 객체 번호 -> 키에 들어갈 작은 번호 (잘라 쓰면 서로 다른 객체가 같은 키가 될 수 있음)
+        self.program_ids = {}
+        self.texture_ids = {}
+
+    @staticmethod
+    def _dense_id(table, glo, limit, what):
+        dense = table.get(glo)
+        if dense is None:
+            dense = len(table)
+            if dense >= limit:
+                raise RuntimeError(f"RenderQueue: {what} 종류가 정렬 키 한도({limit})를 넘었습니다")
+            table[glo] = dense
+        return dense
+
+    @staticmethod
+    def make_key(layer, program_id, kind, texture_id, depth):
+        layer = min(max(int(layer) + 128, 0), 255)  # -128 ~ 127
+        depth = min(max(int(depth) + 32768, 0), 65535)  # -32768 ~ 32767
+        program = (program_id << 1) | kind
+        return (layer << LAYER_SHIFT) | (program << PROGRAM_SHIFT) | (texture_id << TEXTURE_SHIFT) | depth
+
+    def submit_sprite(self, layer, program_glo, texture, depth, x, y, width, height, rotation, uv_offset, uv_scale,
+                      order=0):
+        program_id = self._dense_id(self.program_ids, program_glo, MAX_PROGRAMS, "program")
+        texture_id = self._dense_id(self.texture_ids, texture.glo, MAX_TEXTURES, "texture")
+        self.keys.append(self.make_key(layer, program_id, KIND_SPRITE, texture_id, depth))
+        self.commands.append((KIND_SPRITE, texture, None))
+        self.orders.append(order)
+        self.payloads.append(len(self.sprite_records))
+        self.sprite_records.append((x, y, width, height, rotation,
+                                    uv_offset[0], uv_offset[1], uv_scale[0], uv_scale[1]))
+
+    def submit_callback(self, layer, program_glo, texture_glo, depth, callback, order=0):
+        """스프라이트가 아닌 드로우 (예: 타일맵 청크) - 정렬된 순서에 callback()을 호출"""
+        program_id = self._dense_id(self.program_ids, program_glo, MAX_PROGRAMS, "program")
+        texture_id = self._dense_id(self.texture_ids, texture_glo, MAX_TEXTURES, "texture")
+        self.keys.append(self.make_key(layer, program_id, KIND_CALLBACK, texture_id, depth))
+        self.commands.append((KIND_CALLBACK, None, callback))
+        self.orders.append(order)
+        self.payloads.append(-1)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def sort(self):
+        # 먼저 order로 안정 정렬해 두면 키가 같은 명령끼리는 order 순서가 됨
+        first = np.argsort(np.array(self.orders, dtype=np.int64), kind='stable')
+        return radix_argsort(np.array(self.keys, dtype=np.uint64), order=first)
+
+    def runs(self, order):
+        """정렬된 명령을 (레이어, 프로그램, 텍스처)가 같은 구간으로 나눠
+        (종류, 텍스처, 명령 인덱스 배열)을 돌려줍니다."""
+        keys = np.array(self.keys, dtype=np.uint64)[order]
+        group = keys >> np.uint64(DEPTH_BITS)
+        cuts = (np.flatnonzero(group[1:] != group[:-1]) + 1).tolist()
+
+        start = 0
+        for end in cuts + [len(order)]:
+            idx = order[start:end]
+            kind, texture, _ = self.commands[idx[0]]
+            yield kind, texture, idx
+            start = end
+
+    def sprite_indices(self, command_indices):
+        return np.array(self.payloads, dtype=np.int64)[command_indices]
+
+    def build_instances(self):
+        """모든 스프라이트 레코드를 (N, 10) 인스턴스 데이터로 한 번에 변환 (벡터화)"""
+        n = len(self.sprite_records)
+        if n > len(self.instance_data):
+            # 용량이 부족하면 두 배로 늘림 (프레임마다 재할당하지 않도록 유지)
+            self.instance_data = np.empty((max(n, len(self.instance_data) * 2), self.FLOATS_PER_INSTANCE), dtype='f4')
+        data = self.instance_data[:n]
+        if n == 0:
+            return data
+
+        rec = np.array(self.sprite_records, dtype='f4')
+        # 아핀 행렬을 인스턴스 데이터 자리에 곧바로 기록
+        create_transformation_matrices(
+            rec[:, 0], rec[:, 1], rec[:, 2], rec[:, 3], rec[:, 4],
+            compact=True, out=data[:, 0:6].reshape(n, 2, 3)
+        )
+        data[:, 6:10] = rec[:, 5:9]
+        return data
+
+    def clear(self):
+        self.keys.clear()
+        self.commands.clear()
+        self.payloads.clear()
+        self.orders.clear()
+        self.sprite_records.clear()
@@ -1,4 +1,67 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
-CLEAR_COLOR = (0.1, 0.1, 0.1) # R, G, B
\ No newline at end of file
+CLEAR_COLOR = (0.1, 0.1, 0.1) # R, G, B
+
+# 스프라이트를 텍스처별로 모아 인스턴싱으로 그릴지 여부
+BATCH_RENDERING = True
+
+# 로드한 스프라이트 시트를 큰 텍스처(아틀라스)에 모아서 담을지 여부
+TEXTURE_ATLAS = True
+ATLAS_SIZE = 2048
+ATLAS_PADDING = 1  # 영역 사이 여백 (픽셀)
+
+# GameObject 트랜스폼을 ObjectManager의 NumPy 배열(SoA)에 보관할지 여부
+TRANSFORM_SOA = True
+
+# 컴포넌트를 타입별로 모아서 갱신(시스템 업데이트)할지 여부
+SYSTEM_UPDATE = True
+
+# 카메라 밖 오브젝트를 그리지 않음 (균일 격자 공간 색인 사용)
+FRUSTUM_CULLING = True
+SPATIAL_CELL_SIZE = 256
+
+# 고정 스텝 시뮬레이션: 업데이트는 TICK_RATE로 일정하게, 렌더링은 틱 사이를 보간
+FIXED_TIMESTEP = True
+TICK_RATE = 60
+MAX_CATCHUP_STEPS = 5  # 한 프레임에 따라잡을 최대 업데이트 횟수
+
+# 텍스처 비동기 로드: 디코딩은 스레드 풀에서, GL 업로드는 메인 스레드에서 프레임당 예산만큼
+ASYNC_TEXTURE_LOADING = True
+TEXTURE_LOADER_THREADS = 2
+TEXTURE_UPLOAD_BUDGET_BYTES = 4 * 1024 * 1024  # 프레임당 업로드할 최대 바이트
+TEXTURE_UPLOAD_BUDGET_MS = 2.0                 # 프레임당 업로드에 쓸 최대 시간
+
+# asset_bake.py로 미리 풀어 둔 RGBA 파일을 쓸지 여부 (없거나 원본보다 오래되면 PNG를 디코딩)
+USE_BAKED_ASSETS = True
+BAKED_ASSET_DIR = "baked"
+
+# SpriteRenderer 애니메이션 시계를 배열에 모아 프레임마다 한 번에 진행할지 여부
+VECTORIZED_ANIMATION = True
+
+# 프레임 프로파일러: 스코프 기록을 링 버퍼에 보관, F12로 Chrome trace JSON 저장
+PROFILER_ENABLED = True
+PROFILER_CAPACITY = 65536   # 링 버퍼에 남길 스코프 수
+PROFILER_TRACE_DIR = "traces"
+
+# GPU 타이머 쿼리: 결과는 GPU_QUERY_LATENCY 프레임 뒤에 읽어서 CPU가 GPU를 기다리지 않게 함
+GPU_TIMER_QUERIES = True
+GPU_QUERY_LATENCY = 2
+STATS_OVERLAY = False  # F3으로 켜고 끔
+
+# 타일맵: 청크 하나의 크기 (타일 수, 가로 = 세로). 청크마다 VBO 하나, 보이는 청크만 그림
+TILEMAP_CHUNK_SIZE = 16
+
+# 장면을 낮은 내부 해상도의 오프스크린 버퍼에 그린 뒤 NEAREST로 화면 크기까지 확대 (픽셀 아트용)
+OFFSCREEN_RENDERING = True
+# 최대 내부 해상도. 기본값은 화면 크기라 결과가 직접 그릴 때와 같음
+# 픽셀 아트처럼 낮은 해상도로 그리려면 400 x 300 등으로 낮춤 (화면의 정수 배 분의 1이면 픽셀이 고르게 확대됨)
+INTERNAL_WIDTH = SCREEN_WIDTH
+INTERNAL_HEIGHT = SCREEN_HEIGHT
+
+# 동적 해상도: 측정한 프레임(GPU) 시간이 목표보다 길면 내부 해상도를 한 단계씩 낮추고, 여유가 있으면 올림
+DYNAMIC_RESOLUTION = False
+DYNAMIC_RESOLUTION_LEVELS = (1.0, 0.75, 0.5)  # 최대 내부 해상도 대비 비율
+DYNAMIC_RESOLUTION_TARGET_MS = 1000.0 / FPS
+DYNAMIC_RESOLUTION_HEADROOM = 0.6  # 목표의 이 비율보다 빠르면 한 단계 올림
+DYNAMIC_RESOLUTION_COOLDOWN = 30   # 바꾼 뒤 다시 판단하기까지 기다릴 프레임 수
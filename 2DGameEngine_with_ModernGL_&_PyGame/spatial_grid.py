@@ -0,0 +1,178 @@
+# spatial_grid.py
+import math
+import numpy as np
+
+
+class SpatialGrid:
+    """균일 격자 공간 색인
+
+    오브젝트는 중심점이 속한 셀 하나에만 등록하고(Loose Grid),
+    질의할 때 등록된 오브젝트 중 가장 큰 반경만큼 범위를 넓혀서 찾습니다.
+    셀보다 큰 오브젝트(타일맵 등)는 격자에 넣지 않고 따로 모아 두었다가 질의마다 직접 검사하므로,
+    넓히는 범위는 셀 크기를 넘지 않습니다.
+    """
+    NO_CELL = np.iinfo(np.int64).min
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.cells = {}         # Key: (cx, cy), Value: dict(obj -> None) (순서 있는 집합)
+        self.object_cells = {}  # Key: obj, Value: (cx, cy)
+        self.extents = {}       # Key: obj, Value: (반폭, 반높이)
+        self.max_extent = 0.0   # 격자에 들어 있는 오브젝트 중 가장 큰 반경 (셀 크기 이하)
+        self.large = {}         # 셀보다 큰 오브젝트 (순서 있는 집합)
+
+        # SoA 트랜스폼을 쓸 때 슬롯별로 마지막에 등록된 셀 (변경 감지용)
+        self.slot_cells = np.full((0, 2), self.NO_CELL, dtype=np.int64)
+
+    def _cell_of(self, x, y):
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+    def _ensure_slots(self, capacity):
+        old = len(self.slot_cells)
+        if capacity > old:
+            grown = np.full((capacity, 2), self.NO_CELL, dtype=np.int64)
+            grown[:old] = self.slot_cells
+            self.slot_cells = grown
+
+    def _update_extent(self, obj):
+        hw, hh = obj.get_half_extents()
+        self.extents[obj] = (hw, hh)
+        if hw > self.cell_size or hh > self.cell_size:
+            # 격자에 두면 모든 질의의 여유 범위가 이만큼 커지므로 따로 보관
+            if obj not in self.large:
+                self._unplace(obj)
+                self.large[obj] = None
+            return
+
+        if obj in self.large:
+            del self.large[obj]
+            pos = obj.get_render_position()
+            self._place(obj, self._cell_of(pos[0], pos[1]))
+        if hw > self.max_extent: self.max_extent = hw
+        if hh > self.max_extent: self.max_extent = hh
+
+    def _place(self, obj, cell):
+        old = self.object_cells.get(obj)
+        if old == cell:
+            return
+        if old is not None:
+            bucket = self.cells[old]
+            del bucket[obj]
+            if not bucket:
+                del self.cells[old]
+
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = {}
+            self.cells[cell] = bucket
+        bucket[obj] = None
+        self.object_cells[obj] = cell
+
+        slot = obj._transform_slot
+        if slot is not None:
+            self._ensure_slots(slot + 1)
+            self.slot_cells[slot] = cell
+
+    def _unplace(self, obj):
+        cell = self.object_cells.pop(obj, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        del bucket[obj]
+        if not bucket:
+            del self.cells[cell]
+
+        slot = obj._transform_slot
+        if slot is not None and slot < len(self.slot_cells):
+            self.slot_cells[slot] = self.NO_CELL
+
+    def insert(self, obj):
+        pos = obj.get_render_position()
+        self._place(obj, self._cell_of(pos[0], pos[1]))
+        self._update_extent(obj)  # 셀보다 크면 여기서 large로 옮겨짐
+
+    def remove(self, obj):
+        if self.extents.pop(obj, None) is None:
+            return
+        if obj in self.large:
+            del self.large[obj]
+        else:
+            self._unplace(obj)
+
+    def refresh(self, transforms=None, interpolated=False):
+        """위치가 바뀌어 셀이 달라진 오브젝트만 옮깁니다 (증분 갱신).
+        위치는 그릴 때와 같은 위치(get_render_position)를 씁니다. interpolated면 SoA의 보간된 위치 배열 사용"""
+        if transforms is not None:
+            # SoA: 모든 슬롯의 셀을 한 번에 계산해서 바뀐 것만 골라냄
+            self._ensure_slots(transforms.capacity)
+            slots = np.flatnonzero(transforms.alive)
+            positions = transforms.render_positions if interpolated else transforms.positions
+            cells = np.floor(positions[slots] / self.cell_size).astype(np.int64)
+            changed = np.any(cells != self.slot_cells[slots], axis=1)
+            for slot, (cx, cy) in zip(slots[changed].tolist(), cells[changed].tolist()):
+                obj = transforms.owners[slot]
+                if obj in self.object_cells:
+                    self._place(obj, (cx, cy))
+                    self._update_extent(obj)
+            return
+
+        for obj, cell in list(self.object_cells.items()):
+            pos = obj.get_render_position()
+            new_cell = self._cell_of(pos[0], pos[1])
+            if new_cell != cell:
+                self._place(obj, new_cell)
+                self._update_extent(obj)
+
+    def update_extent(self, obj):
+        """컴포넌트 추가/스케일 변경 등으로 한 오브젝트의 크기가 바뀌었을 때"""
+        if obj in self.extents:
+            self._update_extent(obj)
+
+    def refresh_extents(self):
+        """텍스처 로드 등으로 크기가 바뀌었을 때 모든 오브젝트의 경계를 다시 계산"""
+        self.max_extent = 0.0
+        for obj in list(self.extents):
+            self._update_extent(obj)
+
+    def query(self, left, bottom, right, top):
+        """경계가 사각형과 겹치는 오브젝트 목록"""
+        pad = self.max_extent
+        cx0, cy0 = self._cell_of(left - pad, bottom - pad)
+        cx1, cy1 = self._cell_of(right + pad, top + pad)
+
+        # 줌 아웃으로 범위가 넓으면 빈 셀까지 도는 대신 존재하는 셀만 확인
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+            buckets = [bucket for (cx, cy), bucket in self.cells.items()
+                       if cx0 <= cx <= cx1 and cy0 <= cy <= cy1]
+        else:
+            buckets = []
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    bucket = self.cells.get((cx, cy))
+                    if bucket:
+                        buckets.append(bucket)
+
+        # 셀보다 큰 오브젝트는 격자와 무관하게 항상 검사
+        if self.large:
+            buckets.append(self.large)
+
+        result = []
+        extents = self.extents
+        for bucket in buckets:
+            for obj in bucket:
+                hw, hh = extents[obj]
+                pos = obj.get_render_position()
+                x = pos[0]
+                y = pos[1]
+                if x + hw < left or x - hw > right: continue
+                if y + hh < bottom or y - hh > top: continue
+                result.append(obj)
+        return result
+
+    def clear(self):
+        self.cells.clear()
+        self.object_cells.clear()
+        self.extents.clear()
+        self.large.clear()
+        self.max_extent = 0.0
+        self.slot_cells[:] = self.NO_CELL
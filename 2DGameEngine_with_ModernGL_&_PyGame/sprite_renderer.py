@@ -1,12 +1,10 @@
 # sprite_renderer.py
-# [중요] 변수 직접 import 제거
-# from camera import active_camera  <-- 이거 지우세요!
-import camera  # 모듈 전체 import
-
+from settings import ASYNC_TEXTURE_LOADING, VECTORIZED_ANIMATION
 from component import Component
 from graphic_sys import sys_graphics
 from texture_sys import sys_textures
-from transform import create_transformation_matrix
+from animation_sys import sys_animation
+from object_manager import sys_objects
 
 
 # AnimationData 클래스는 그대로...
@@ -17,23 +15,124 @@ class AnimationData:
         self.slice_y = slice_y
         self.duration = duration
         self.total_frames = slice_x * slice_y
-        self.frame_width = texture.width / slice_x
-        self.frame_height = texture.height / slice_y
+
+        # 프레임별 UV (오프셋, 스케일)을 미리 계산: 좌우 반전은 u를 오른쪽 끝에서 시작하고 폭을 음수로
+        uv_w = 1.0 / slice_x
+        uv_h = 1.0 / slice_y
+        self.uv_rects = []
+        self.uv_rects_flipped = []
+        for idx in range(self.total_frames):
+            uv_x = (idx % slice_x) * uv_w
+            uv_y = (idx // slice_x) * uv_h
+            self.uv_rects.append(((uv_x, uv_y), (uv_w, uv_h)))
+            self.uv_rects_flipped.append(((uv_x + uv_w, uv_y), (-uv_w, uv_h)))
+
+    # 비동기 로드 중에는 텍스처 크기가 임시(1x1)이므로 프레임 크기는 매번 텍스처에서 계산
+    @property
+    def frame_width(self):
+        return self.texture.width / self.slice_x
+
+    @property
+    def frame_height(self):
+        return self.texture.height / self.slice_y
 
 
 class SpriteRenderer(Component):
+    # 배열 애니메이션 시계를 쓰면 개별 update 대신 sys_animation.advance()가 한꺼번에 진행
+    batched_update = VECTORIZED_ANIMATION
+
     def __init__(self, game_object):
+        # 애니메이션 시계: 등록되어 있는 동안은 sys_animation 배열에 보관됨
+        self._anim_slot = None
+        self._timer = 0
+        self._frame_idx = 0
+        self._flip_x = False
+        self._active = True
         super().__init__(game_object)
         self.animations = {}
         self.current_anim = None
         self.current_anim_name = ""
+        self.render_scale = 1.0
+
+        # 렌더 큐 정렬 키: 레이어가 높을수록 위에 그려지고, 같은 레이어 안에서는
+        # 텍스처별로 묶인 뒤 depth가 큰 것이 나중에 그려집니다. 모두 같으면 먼저 생성된 오브젝트가 아래.
+        self.layer = 0
+        self.depth = 0
+
+    # --- 애니메이션 시계 (배열 또는 인스턴스 변수) ---
+    @property
+    def timer(self):
+        if self._anim_slot is not None:
+            return sys_animation.timers[self._anim_slot]
+        return self._timer
+
+    @timer.setter
+    def timer(self, value):
+        if self._anim_slot is not None:
+            sys_animation.timers[self._anim_slot] = value
+        else:
+            self._timer = value
+
+    @property
+    def current_frame_idx(self):
+        if self._anim_slot is not None:
+            return int(sys_animation.frame_idx[self._anim_slot])
+        return self._frame_idx
+
+    @current_frame_idx.setter
+    def current_frame_idx(self, value):
+        if self._anim_slot is not None:
+            sys_animation.frame_idx[self._anim_slot] = value
+        else:
+            self._frame_idx = value
+
+    @property
+    def flip_x(self):
+        if self._anim_slot is not None:
+            return bool(sys_animation.flip[self._anim_slot])
+        return self._flip_x
+
+    @flip_x.setter
+    def flip_x(self, value):
+        if self._anim_slot is not None:
+            sys_animation.flip[self._anim_slot] = value
+        else:
+            self._flip_x = value
+
+    @property
+    def active(self):
+        return self._active
+
+    @active.setter
+    def active(self, value):
+        self._active = value
+        if self._anim_slot is not None:
+            sys_animation.sync_enabled(self)
+
+    def on_register(self):
+        if VECTORIZED_ANIMATION:
+            sys_animation.attach(self)
+
+    def on_unregister(self):
+        if self._anim_slot is not None:
+            sys_animation.detach(self)
+
+    def on_active_changed(self):
+        if self._anim_slot is not None:
+            sys_animation.sync_enabled(self)
+
+    def on_acquire(self):
+        # 재사용될 때 현재 애니메이션을 처음부터 다시 재생
         self.timer = 0
         self.current_frame_idx = 0
         self.flip_x = False
-        self.render_scale = 1.0
 
     def add_animation(self, name, texture_path, slice_x=1, slice_y=1, duration=0.15):
-        texture = sys_textures.load(texture_path)
+        # 비동기 모드면 핸들을 바로 받고, 실제 이미지는 업로드가 끝난 프레임부터 보임
+        if ASYNC_TEXTURE_LOADING:
+            texture = sys_textures.load_async(texture_path)
+        else:
+            texture = sys_textures.load(texture_path)
         if texture:
             anim_data = AnimationData(texture, slice_x, slice_y, duration)
             self.animations[name] = anim_data
@@ -45,6 +144,7 @@ class SpriteRenderer(Component):
 
     def set_scale(self, scale_factor):
         self.render_scale = scale_factor
+        sys_objects.refresh_bounds(self.game_object)
 
     def play(self, name):
         if name == self.current_anim_name: return
@@ -53,8 +153,18 @@ class SpriteRenderer(Component):
             self.current_anim = self.animations[name]
             self.timer = 0
             self.current_frame_idx = 0
+            if self._anim_slot is not None:
+                sys_animation.set_clip(self)
+                sys_animation.sync_enabled(self)
+            sys_objects.refresh_bounds(self.game_object)  # 프레임 크기가 다를 수 있음
+
+    def get_half_extents(self):
+        if not self.current_anim: return None
+        return (self.current_anim.frame_width * self.render_scale / 2,
+                self.current_anim.frame_height * self.render_scale / 2)
 
     def update(self, dt):
+        # VECTORIZED_ANIMATION이면 호출되지 않음 (sys_animation.advance가 같은 규칙으로 진행)
         if self.current_anim:
             self.timer += dt
             if self.timer >= self.current_anim.duration:
@@ -65,42 +175,28 @@ class SpriteRenderer(Component):
         if not self.current_anim: return
 
         anim = self.current_anim
-
-        uv_w = 1.0 / anim.slice_x
-        uv_h = 1.0 / anim.slice_y
-        col = self.current_frame_idx % anim.slice_x
-        row = self.current_frame_idx // anim.slice_x
-        uv_x = col * uv_w
-        uv_y = row * uv_h
-
         if self.flip_x:
-            uv_x = uv_x + uv_w
-            uv_w = -uv_w
+            uv_offset, uv_scale = anim.uv_rects_flipped[self.current_frame_idx]
+        else:
+            uv_offset, uv_scale = anim.uv_rects[self.current_frame_idx]
 
         final_width = anim.frame_width * self.render_scale
         final_height = anim.frame_height * self.render_scale
 
-        model_matrix = create_transformation_matrix(
-            self.game_object.position[0],
-            self.game_object.position[1],
+        # 모델 행렬은 graphic_sys가 만듭니다.
+        # (배치 모드: flush 때 모든 스프라이트를 한 번에 벡터화 계산 / 단발성: 미리 잡아둔 버퍼에 바로 기록)
+        # 뷰-투영 행렬은 graphic_sys가 활성 카메라에서 직접 가져옵니다.
+        pos = self.game_object.get_render_position()  # 고정 스텝이면 보간된 위치
+        sys_graphics.submit_sprite(
+            anim.texture,
+            pos[0],
+            pos[1],
             final_width,
             final_height,
-            rotation_rad=0
-        )
-
-        # [수정] 뷰 행렬은 여기서 구하지 않고 graphic_sys에게 맡기거나,
-        # graphic_sys가 인자를 받도록 통일해야 합니다.
-        # 현재 graphic_sys는 인자를 받아도 무시하고 내부에서 active_camera를 쓰므로
-        # 여기서는 None을 넘겨도 되지만, 명확성을 위해 모듈 접근 방식으로 넘깁니다.
-
-        vp_matrix = None
-        if camera.active_camera:  # camera 모듈을 통해 접근 (안전함)
-            vp_matrix = camera.active_camera.get_view_projection_matrix()
-
-        sys_graphics.render_sprite(
-            anim.texture,
-            model_matrix,
-            vp_matrix,
-            uv_offset=(uv_x, uv_y),
-            uv_scale=(uv_w, uv_h)
+            rotation=self.game_object.get_render_rotation(),
+            uv_offset=uv_offset,
+            uv_scale=uv_scale,
+            layer=self.layer,
+            depth=self.depth,
+            order=self.game_object._spawn_index  # 같은 키끼리는 생성 순서대로 (컬링 순서와 무관)
         )
\ No newline at end of file
@@ -1,14 +1,130 @@
 # resources.py
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import moderngl
-from PIL import Image
+import numpy as np
+from settings import (TEXTURE_ATLAS, ATLAS_SIZE, ATLAS_PADDING, TEXTURE_LOADER_THREADS,
+                      TEXTURE_UPLOAD_BUDGET_BYTES, TEXTURE_UPLOAD_BUDGET_MS,
+                      USE_BAKED_ASSETS, BAKED_ASSET_DIR)
 from graphic_sys import sys_graphics
+from asset_bake import asset_key, source_stamp, load_manifest
+
+
+class TextureRegion:
+    """load()가 돌려주는 핸들: GL 텍스처(또는 아틀라스)와 그 안의 영역"""
+    def __init__(self, texture, x, y, width, height, atlas=None, path=None):
+        self.path = path
+        self.ready = True  # 비동기 로드 중이면 False (1x1 임시 텍스처를 가리킴)
+        self._assign(texture, x, y, width, height, atlas)
+
+    def _assign(self, texture, x, y, width, height, atlas=None):
+        self.texture = texture  # 실제로 바인딩될 moderngl 텍스처
+        self.atlas = atlas      # 아틀라스에 들어갔으면 TextureAtlas, 아니면 None
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+        # 시트 기준 UV(0~1)를 텍스처 기준 UV로 바꾸기 위한 값
+        tex_w, tex_h = texture.size
+        self.u0 = x / tex_w
+        self.v0 = y / tex_h
+        self.du = width / tex_w
+        self.dv = height / tex_h
+
+    def map_uv(self, uv_offset, uv_scale):
+        """시트 안에서 계산한 UV 오프셋/스케일을 실제 텍스처 좌표로 변환"""
+        return (
+            (self.u0 + uv_offset[0] * self.du, self.v0 + uv_offset[1] * self.dv),
+            (uv_scale[0] * self.du, uv_scale[1] * self.dv)
+        )
+
+
+class ShelfPacker:
+    """선반(Shelf) 방식 빈 패킹: 높이가 비슷한 이미지를 같은 줄에 채워 넣습니다."""
+    def __init__(self, width, height, padding=0):
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.shelves = []  # [y, 높이, 다음 x]
+        self.next_y = 0
+        self.used_area = 0
+
+    def allocate(self, w, h):
+        pw = w + self.padding
+        ph = h + self.padding
+
+        # 1. 들어갈 수 있는 선반 중 남는 높이가 가장 적은 곳 (Best Fit)
+        best = None
+        for shelf in self.shelves:
+            y, shelf_h, cursor = shelf
+            if ph <= shelf_h and cursor + pw <= self.width:
+                if best is None or shelf_h < best[1]:
+                    best = shelf
+
+        # 2. 없으면 새 선반을 엽니다.
+        if best is None:
+            if self.next_y + ph > self.height or pw > self.width:
+                return None
+            best = [self.next_y, ph, 0]
+            self.shelves.append(best)
+            self.next_y += ph
+
+        x, y = best[2], best[0]
+        best[2] += pw
+        self.used_area += w * h
+        return x, y
+
+    def occupancy(self):
+        return self.used_area / float(self.width * self.height)
+
+
+class TextureAtlas:
+    def __init__(self, ctx, size, padding):
+        self.size = size
+        # 빈 곳이 샘플링되어도 투명하도록 0으로 채워서 생성
+        self.texture = ctx.texture((size, size), 4, bytes(size * size * 4))
+        self.texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        self.packer = ShelfPacker(size, size, padding)
+        self.region_count = 0
+
+    def insert(self, img_size, data, path):
+        pos = self.packer.allocate(*img_size)
+        if pos is None:
+            return None
+
+        x, y = pos
+        w, h = img_size
+        self.texture.write(data, viewport=(x, y, w, h))
+        self.region_count += 1
+        return TextureRegion(self.texture, x, y, w, h, atlas=self, path=path)
 
 
 class TextureManager:
     def __init__(self):
-        self.textures = {}
+        self.textures = {}  # Key: path, Value: TextureRegion
+        self.atlas_mode = TEXTURE_ATLAS
+        self.atlases = []
+
+        # 비동기 로드: 디코딩은 스레드 풀에서, GL 업로드는 메인 스레드에서 프레임 예산만큼
+        self.executor = None
+        self.pending = {}  # Key: path, Value: (TextureRegion, Future) - 요청 순서 유지
+        self.placeholder = None
+
+        # asset_bake.py로 구운 RGBA 파일 (없거나 오래되면 PNG를 직접 디코딩)
+        self.use_baked = USE_BAKED_ASSETS
+        self.baked_dir = BAKED_ASSET_DIR
+        self.manifest = None  # 처음 로드할 때 읽음
+        self.load_stats = {'baked': 0, 'png': 0}  # 메인 스레드에서만 갱신
 
     def load(self, path):
+        if path in self.pending:
+            # 비동기로 요청된 것을 즉시 필요로 하면 디코딩을 기다렸다가 바로 업로드
+            region, future = self.pending.pop(path)
+            self._finish(region, future)
+            return region if region.ready else None
+
         if path in self.textures:
             return self.textures[path]
 
@@ -18,15 +134,180 @@ class TextureManager:
             raise Exception("Graphics context not initialized yet.")
 
         try:
-            img = Image.open(path).convert('RGBA')
-            texture = ctx.texture(img.size, 4, img.tobytes())
-            texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
-            self.textures[path] = texture
-            return texture
+            size, data, source = self._read_image(path)
         except FileNotFoundError:
             print(f"Error: Texture not found at {path}")
             return None
+        self.load_stats[source] += 1
+
+        region = self._upload(ctx, path, size, data)
+        self.textures[path] = region
+        return region
+
+    def load_async(self, path):
+        """디코딩을 백그라운드 스레드에 맡기고 핸들을 바로 돌려줍니다.
+
+        업로드가 끝날 때까지 핸들은 1x1 투명 임시 텍스처를 가리키며(ready == False),
+        process_uploads()가 실제 텍스처로 바꿔 끼웁니다.
+        """
+        if path in self.textures:
+            return self.textures[path]
+
+        ctx = sys_graphics.ctx
+        if not ctx:
+            raise Exception("Graphics context not initialized yet.")
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=TEXTURE_LOADER_THREADS,
+                                               thread_name_prefix="texture-decode")
+
+        region = TextureRegion(self._get_placeholder(ctx), 0, 0, 1, 1, path=path)
+        region.ready = False
+        self.textures[path] = region
+        self.manifest_entry(path)  # 매니페스트는 메인 스레드에서 미리 읽어 둠
+        self.pending[path] = (region, self.executor.submit(self._read_image, path))
+        return region
+
+    def _read_image(self, path):
+        """(크기, RGBA 데이터, 'baked' 또는 'png'): 베이크 파일이 최신이면 memmap, 아니면 PNG 디코딩
+
+        비동기 로드에서는 작업 스레드에서 실행되므로 GL 호출이나 공유 상태 변경을 하면 안 됩니다.
+        (load_stats는 결과를 받은 메인 스레드에서 셉니다)
+        """
+        baked = self._read_baked(path)
+        if baked is not None:
+            size, data = baked
+            return size, data, 'baked'
+
+        from PIL import Image  # 베이크를 쓰면 Pillow를 아예 불러오지 않음
+        img = Image.open(path).convert('RGBA')
+        return img.size, img.tobytes(), 'png'
+
+    def manifest_entry(self, path):
+        if not self.use_baked:
+            return None
+        if self.manifest is None:
+            self.manifest = load_manifest(self.baked_dir) or {'assets': {}}
+        return self.manifest['assets'].get(asset_key(path))
+
+    def _read_baked(self, path):
+        entry = self.manifest_entry(path)
+        if entry is None:
+            return None
+
+        # 원본이 베이크 이후에 바뀌었으면 (크기/수정 시각) PNG로 대체
+        try:
+            if source_stamp(path) != (entry['source_mtime_ns'], entry['source_size']):
+                return None
+        except FileNotFoundError:
+            pass  # 배포본처럼 원본 없이 베이크 파일만 있어도 됨
+
+        w, h = entry['width'], entry['height']
+        blob_path = os.path.join(self.baked_dir, entry['blob'])
+        try:
+            if os.path.getsize(blob_path) != w * h * 4:
+                return None
+        except FileNotFoundError:
+            return None
+
+        # 복사 없이 파일을 그대로 매핑해서 GL 업로드에 넘김 (버퍼 프로토콜)
+        return (w, h), np.memmap(blob_path, dtype=np.uint8, mode='r', shape=(h, w * 4))
+
+    def _get_placeholder(self, ctx):
+        if self.placeholder is None:
+            self.placeholder = ctx.texture((1, 1), 4, bytes(4))
+            self.placeholder.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        return self.placeholder
+
+    def _finish(self, region, future):
+        try:
+            size, data, source = future.result()
+        except FileNotFoundError:
+            print(f"Error: Texture not found at {region.path}")
+            # 실패한 핸들은 임시 텍스처를 계속 가리키고, 다음 load()에서 다시 시도할 수 있게 함
+            self.textures.pop(region.path, None)
+            return 0
+        self.load_stats[source] += 1
+
+        loaded = self._upload(sys_graphics.ctx, region.path, size, data)
+        region._assign(loaded.texture, loaded.x, loaded.y, loaded.width, loaded.height, loaded.atlas)
+        region.ready = True
+        return size[0] * size[1] * 4
+
+    def process_uploads(self, budget_bytes=TEXTURE_UPLOAD_BUDGET_BYTES, budget_ms=TEXTURE_UPLOAD_BUDGET_MS):
+        """디코딩이 끝난 텍스처를 예산(바이트, 밀리초) 안에서 GPU로 올립니다 (메인 스레드, 프레임당 1회).
+
+        진행이 멈추지 않도록 예산과 관계없이 최소 하나는 올리며, 업로드한 개수를 돌려줍니다.
+        """
+        if not self.pending:
+            return 0
+
+        start = time.perf_counter()
+        uploaded_bytes = 0
+        count = 0
+        for path, (region, future) in list(self.pending.items()):
+            if not future.done():
+                continue
+            if count > 0:
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                if uploaded_bytes >= budget_bytes or elapsed_ms >= budget_ms:
+                    break
+
+            del self.pending[path]
+            uploaded_bytes += self._finish(region, future)
+            count += 1
+        return count
+
+    def is_loading(self):
+        return bool(self.pending)
+
+    def wait_for_uploads(self):
+        """로딩 화면 등에서 요청된 텍스처를 모두 기다렸다가 올립니다."""
+        while self.pending:
+            path, (region, future) = next(iter(self.pending.items()))
+            del self.pending[path]
+            self._finish(region, future)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def _upload(self, ctx, path, size, data):
+        if self.atlas_mode:
+            region = self._insert_into_atlas(ctx, path, size, data)
+            if region:
+                return region
+
+        # 아틀라스를 끄거나, 아틀라스보다 큰 이미지는 단독 텍스처로
+        texture = ctx.texture(size, 4, data)
+        texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        return TextureRegion(texture, 0, 0, size[0], size[1], path=path)
+
+    def _insert_into_atlas(self, ctx, path, size, data):
+        if size[0] + ATLAS_PADDING > ATLAS_SIZE or size[1] + ATLAS_PADDING > ATLAS_SIZE:
+            return None
+
+        for atlas in self.atlases:
+            region = atlas.insert(size, data, path)
+            if region:
+                return region
+
+        atlas = TextureAtlas(ctx, ATLAS_SIZE, ATLAS_PADDING)
+        self.atlases.append(atlas)
+        return atlas.insert(size, data, path)
+
+    def get_atlas_stats(self):
+        """아틀라스별 점유율 통계"""
+        return [
+            {
+                'size': atlas.size,
+                'regions': atlas.region_count,
+                'occupancy': atlas.packer.occupancy(),
+            }
+            for atlas in self.atlases
+        ]
 
 
 # 모듈 레벨 싱글톤 인스턴스
-sys_textures = TextureManager()
\ No newline at end of file
+sys_textures = TextureManager()
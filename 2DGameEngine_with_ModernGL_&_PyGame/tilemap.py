@@ -0,0 +1,247 @@
+# tilemap.py
+import math
+from functools import partial
+import moderngl
+import numpy as np
+import camera
+from settings import TILEMAP_CHUNK_SIZE
+from component import Component
+from graphic_sys import sys_graphics, RenderContext
+from texture_sys import sys_textures
+
+EMPTY_TILE = -1
+
+
+class TileChunk:
+    """청크 하나의 정적 정점 버퍼 (타일당 삼각형 2개)"""
+    def __init__(self, cx, cy):
+        self.cx = cx
+        self.cy = cy
+        self.vbo = None
+        self.vao = None
+        self.vertex_count = 0
+        self.callback = None  # 렌더 큐에 제출할 그리기 함수
+
+    def release(self):
+        self.vao.release()
+        self.vbo.release()
+
+
+class Tilemap(Component):
+    """타일 번호 격자를 타일셋 이미지로 그리는 정적 배경 컴포넌트
+
+    - tiles[row][col]: 타일셋에서 왼쪽 위부터 가로로 센 번호 (EMPTY_TILE이면 비움), row 0이 맨 위 줄
+    - 오브젝트 위치가 맵의 중심이며, 회전/스케일은 적용하지 않습니다.
+    - 청크(chunk_size x chunk_size 타일)마다 VBO를 하나씩 미리 만들어 두고,
+      카메라에 보이는 청크만 청크당 드로우 한 번으로 그립니다.
+    """
+    _program = None  # 모든 타일맵이 함께 쓰는 셰이더 프로그램
+
+    def __init__(self, game_object, tileset_path, tile_width, tile_height, tiles,
+                 scale=1.0, chunk_size=TILEMAP_CHUNK_SIZE, layer=-1):
+        super().__init__(game_object)
+        self.tileset = sys_textures.load(tileset_path)  # 배경은 처음부터 보여야 하므로 동기 로드
+        self.tile_width = tile_width      # 타일셋에서의 타일 크기 (픽셀)
+        self.tile_height = tile_height
+        self.columns_in_tileset = int(self.tileset.width // tile_width)
+        self.cell_width = tile_width * scale  # 월드에서 그려지는 타일 크기
+        self.cell_height = tile_height * scale
+        self.chunk_size = chunk_size
+        self.layer = layer  # 스프라이트(기본 0)보다 아래에 그려지도록 기본 -1
+
+        self.tiles = np.array(tiles, dtype=np.int32)
+        self.rows, self.cols = self.tiles.shape
+        self.width = self.cols * self.cell_width
+        self.height = self.rows * self.cell_height
+
+        self.chunks = {}  # Key: (청크 열, 청크 행), Value: TileChunk
+        self.program = self._get_program()
+        self._build_uv_table()
+        self.build()
+
+    @classmethod
+    def _get_program(cls):
+        if cls._program is None:
+            ctx = sys_graphics.ctx
+            cls._program = ctx.program(
+                vertex_shader="""
+                #version 330
+                in vec2 in_vert;  // 맵 중심 기준 좌표
+                in vec2 in_uv;
+                out vec2 v_uv;
+
+                layout(std140) uniform CameraBlock {
+                    mat4 u_view_projection;
+                };
+                uniform vec2 u_origin;  // 맵 중심의 월드 좌표 (움직여도 VBO를 다시 만들 필요 없음)
+
+                void main() {
+                    v_uv = in_uv;
+                    gl_Position = u_view_projection * vec4(in_vert + u_origin, 0.0, 1.0);
+                }
+                """,
+                fragment_shader="""
+                #version 330
+                in vec2 v_uv;
+                out vec4 f_color;
+                uniform sampler2D u_texture;
+                uniform float u_alpha_threshold;
+
+                void main() {
+                    vec4 tex_color = texture(u_texture, v_uv);
+                    if (tex_color.a < u_alpha_threshold) discard;
+                    f_color = tex_color;
+                }
+                """
+            )
+            cls._program['CameraBlock'].binding = RenderContext.BINDING
+            sys_graphics.register_program(cls._program, {'u_texture': 0, 'u_alpha_threshold': 0.1})
+        return cls._program
+
+    def _build_uv_table(self):
+        # 타일 번호 -> (u0, v0, u1, v1): 아틀라스 안이면 실제 텍스처 좌표로 변환
+        count = self.columns_in_tileset * int(self.tileset.height // self.tile_height)
+        idx = np.arange(count)
+        du = self.tile_width / self.tileset.width
+        dv = self.tile_height / self.tileset.height
+        region = self.tileset
+        u0 = region.u0 + (idx % self.columns_in_tileset) * du * region.du
+        v0 = region.v0 + (idx // self.columns_in_tileset) * dv * region.dv
+        self.uv_table = np.stack([u0, v0, u0 + du * region.du, v0 + dv * region.dv], axis=1).astype('f4')
+
+    # --- 청크 빌드 ---
+    def _chunk_vertices(self, cx, cy):
+        cs = self.chunk_size
+        block = self.tiles[cy * cs:(cy + 1) * cs, cx * cs:(cx + 1) * cs]
+        rows, cols = np.nonzero(block >= 0)
+        if len(rows) == 0:
+            return None
+
+        ids = np.minimum(block[rows, cols], len(self.uv_table) - 1)
+        rows = rows + cy * cs
+        cols = cols + cx * cs
+
+        # 타일 사각형 (맵 중심 기준): row 0이 맨 위
+        x0 = cols * self.cell_width - self.width / 2
+        x1 = x0 + self.cell_width
+        y1 = self.height / 2 - rows * self.cell_height
+        y0 = y1 - self.cell_height
+        u0, v0, u1, v1 = self.uv_table[ids].T
+
+        # 이미지 첫 행이 v=0이므로 위쪽 정점이 v0
+        corners = [
+            (x0, y0, u0, v1), (x1, y0, u1, v1), (x0, y1, u0, v0),
+            (x0, y1, u0, v0), (x1, y0, u1, v1), (x1, y1, u1, v0),
+        ]
+        data = np.empty((len(ids), 6, 4), dtype='f4')
+        for i, (x, y, u, v) in enumerate(corners):
+            data[:, i, 0] = x
+            data[:, i, 1] = y
+            data[:, i, 2] = u
+            data[:, i, 3] = v
+        return data
+
+    def _rebuild_chunk(self, cx, cy):
+        data = self._chunk_vertices(cx, cy)
+        chunk = self.chunks.get((cx, cy))
+        if data is None:
+            if chunk is not None:
+                chunk.release()
+                del self.chunks[(cx, cy)]
+            return
+
+        if chunk is None:
+            chunk = TileChunk(cx, cy)
+            chunk.vbo = sys_graphics.ctx.buffer(data.tobytes())
+            chunk.vao = sys_graphics.ctx.vertex_array(self.program, [
+                (chunk.vbo, '2f 2f', 'in_vert', 'in_uv')
+            ])
+            chunk.callback = partial(self._draw_chunk, chunk)
+            self.chunks[(cx, cy)] = chunk
+        else:
+            if data.nbytes > chunk.vbo.size:
+                chunk.vbo.orphan(data.nbytes)
+            chunk.vbo.write(data.tobytes())
+        chunk.vertex_count = data.shape[0] * 6
+
+    def build(self):
+        """모든 청크의 VBO를 만듭니다 (로드 시 한 번)."""
+        cs = self.chunk_size
+        for cy in range(math.ceil(self.rows / cs)):
+            for cx in range(math.ceil(self.cols / cs)):
+                self._rebuild_chunk(cx, cy)
+
+    def release(self):
+        """모든 청크의 VAO/VBO를 해제합니다."""
+        for chunk in self.chunks.values():
+            chunk.release()
+        self.chunks.clear()
+
+    def on_register(self):
+        # 해제된 뒤 다시 등록되면 청크를 새로 만듦
+        if not self.chunks:
+            self.build()
+
+    def on_unregister(self):
+        # 컴포넌트/오브젝트 제거나 ObjectManager.clear() 때 GPU 버퍼가 새지 않도록
+        self.release()
+
+    def get_tile(self, col, row):
+        return int(self.tiles[row, col])
+
+    def set_tile(self, col, row, tile_id):
+        """타일 하나를 바꾸고 그 타일이 속한 청크만 다시 만듭니다."""
+        if self.tiles[row, col] == tile_id:
+            return
+        self.tiles[row, col] = tile_id
+        self._rebuild_chunk(col // self.chunk_size, row // self.chunk_size)
+
+    # --- 좌표 변환 ---
+    def world_to_cell(self, x, y):
+        """월드 좌표 -> (열, 행). 맵 밖이어도 계산된 값을 그대로 돌려줌"""
+        ox, oy = self.game_object.position[0], self.game_object.position[1]
+        col = math.floor((x - ox + self.width / 2) / self.cell_width)
+        row = math.floor((oy + self.height / 2 - y) / self.cell_height)
+        return col, row
+
+    def get_half_extents(self):
+        return self.width / 2, self.height / 2
+
+    # --- 렌더링 ---
+    def render(self):
+        if not self.chunks:
+            return
+
+        origin = self.game_object.get_render_position()
+        ox, oy = origin[0], origin[1]
+        cs = self.chunk_size
+        max_cx = math.ceil(self.cols / cs) - 1
+        max_cy = math.ceil(self.rows / cs) - 1
+
+        cam = camera.active_camera
+        if cam is None:
+            cx0, cy0, cx1, cy1 = 0, 0, max_cx, max_cy
+        else:
+            left, bottom, right, top = cam.get_visible_rect()
+            # 카메라 사각형을 타일 -> 청크 범위로 변환 (row는 위에서 아래로 증가)
+            cx0 = max(0, math.floor((left - ox + self.width / 2) / self.cell_width) // cs)
+            cx1 = min(max_cx, math.floor((right - ox + self.width / 2) / self.cell_width) // cs)
+            cy0 = max(0, math.floor((oy + self.height / 2 - top) / self.cell_height) // cs)
+            cy1 = min(max_cy, math.floor((oy + self.height / 2 - bottom) / self.cell_height) // cs)
+
+        self._origin = (float(ox), float(oy))
+        texture = self.tileset.texture
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                chunk = self.chunks.get((cx, cy))
+                if chunk is not None:
+                    sys_graphics.submit_callback(chunk.callback, layer=self.layer,
+                                                 program=self.program, texture=texture,
+                                                 order=self.game_object._spawn_index)
+
+    def _draw_chunk(self, chunk):
+        # 렌더 큐 flush 중에 정렬된 순서대로 호출됨
+        sys_graphics.bind_texture(self.tileset.texture)
+        sys_graphics.set_uniform(self.program, 'u_origin', self._origin)
+        chunk.vao.render(moderngl.TRIANGLES, vertices=chunk.vertex_count)
+        sys_graphics.record_draw(chunk.vertex_count)
@@ -1,4 +1,5 @@
 # transform.py
+import math
 import numpy as np
 
 
@@ -24,27 +25,73 @@ def create_ortho_projection(left, right, bottom, top, near, far):
     return M
 
 
+def write_transformation_matrix(out, x, y, scale_x, scale_y, rotation_rad=0):
+    """모델 행렬을 미리 잡아둔 4x4 버퍼에 곱셈 없이 바로 채움 (크기 -> 회전 -> 이동)"""
+    if rotation_rad:
+        cos_t = math.cos(rotation_rad)
+        sin_t = math.sin(rotation_rad)
+    else:
+        cos_t, sin_t = 1.0, 0.0
+
+    # S @ R @ T 를 풀어서 쓴 결과와 같습니다.
+    out[0, 0] = scale_x * cos_t
+    out[0, 1] = scale_x * sin_t
+    out[1, 0] = -scale_y * sin_t
+    out[1, 1] = scale_y * cos_t
+    out[3, 0] = x
+    out[3, 1] = y
+    return out
+
+
 def create_transformation_matrix(x, y, scale_x, scale_y, rotation_rad=0):
     """모델 행렬 생성 (크기 -> 회전 -> 이동)"""
-    # 1. 이동 (Translation)
-    T = np.identity(4, dtype='f4')
-    T[3, 0] = x
-    T[3, 1] = y
-
-    # 2. 회전 (Rotation - Z축 기준)
-    R = np.identity(4, dtype='f4')
-    cos_t = np.cos(rotation_rad)
-    sin_t = np.sin(rotation_rad)
-    R[0, 0] = cos_t
-    R[0, 1] = sin_t
-    R[1, 0] = -sin_t
-    R[1, 1] = cos_t
-
-    # 3. 크기 (Scale)
-    S = np.identity(4, dtype='f4')
-    S[0, 0] = scale_x
-    S[1, 1] = scale_y
-
-    # 순서: Scale -> Rotate -> Translate
-    # 행렬 곱셈: T * R * S
-    return S @ R @ T
\ No newline at end of file
+    # 순서: Scale -> Rotate -> Translate (행렬 곱셈: S @ R @ T)
+    # 세 행렬을 만들어 곱하는 대신 결과를 직접 채웁니다.
+    return write_transformation_matrix(
+        np.identity(4, dtype='f4'), x, y, scale_x, scale_y, rotation_rad
+    )
+
+
+def create_transformation_matrices(xs, ys, scale_xs, scale_ys, rotations=None, compact=False, out=None):
+    """N개 오브젝트의 모델 행렬을 한 번에 생성 (벡터화)
+
+    compact=False 이면 (N, 4, 4) 행렬 (create_transformation_matrix와 같은 배치),
+    compact=True 이면 (N, 2, 3) 아핀 행렬 [[a, c, x], [b, d, y]] 을 돌려줍니다.
+    (x' = a*vx + c*vy + x,  y' = b*vx + d*vy + y)
+    """
+    xs = np.asarray(xs, dtype='f4')
+    ys = np.asarray(ys, dtype='f4')
+    scale_xs = np.asarray(scale_xs, dtype='f4')
+    scale_ys = np.asarray(scale_ys, dtype='f4')
+    n = len(xs)
+
+    if rotations is None:
+        cos_t = 1.0
+        sin_t = 0.0
+    else:
+        rotations = np.asarray(rotations, dtype='f4')
+        cos_t = np.cos(rotations)
+        sin_t = np.sin(rotations)
+
+    if compact:
+        if out is None:
+            out = np.empty((n, 2, 3), dtype='f4')
+        out[:, 0, 0] = scale_xs * cos_t
+        out[:, 0, 1] = -scale_ys * sin_t
+        out[:, 0, 2] = xs
+        out[:, 1, 0] = scale_xs * sin_t
+        out[:, 1, 1] = scale_ys * cos_t
+        out[:, 1, 2] = ys
+        return out
+
+    if out is None:
+        out = np.zeros((n, 4, 4), dtype='f4')
+        out[:, 2, 2] = 1.0
+        out[:, 3, 3] = 1.0
+    out[:, 0, 0] = scale_xs * cos_t
+    out[:, 0, 1] = scale_xs * sin_t
+    out[:, 1, 0] = -scale_ys * sin_t
+    out[:, 1, 1] = scale_ys * cos_t
+    out[:, 3, 0] = xs
+    out[:, 3, 1] = ys
+    return out
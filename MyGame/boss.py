@@ -5,7 +5,7 @@ import game_world
 import play_mode
 from pico2d import *
 from state_machine import StateMachine
-from bullet import Bullet
+from bullet import bullets
 
 # --------------------------------------------------------------------------------
 # 상수 설정
@@ -415,11 +415,8 @@ class Boss:
         self.draw_hp_bar()
 
     def fire_bullet(self, angle):
-        bullet = Bullet(self.x, self.y, angle)
-        game_world.add_object(bullet, 2)
-        # 💖 보스가 쏜 총알은 player와, player의 sword와 충돌함
-        game_world.add_collision_pair('player:enemy_bullet', None, bullet)
-        game_world.add_collision_pair('sword:enemy_bullet', None, bullet)
+        # 💖 보스가 쏜 총알은 player와, player의 sword와 충돌함 (충돌 그룹은 play_mode.init에서 풀 단위로 등록)
+        bullets.spawn(self.x, self.y, angle)
 
     def get_bb(self):
         w = (50 * self.draw_scale) * 0.5
@@ -1,56 +1,44 @@
-import math
-import game_framework
 from pico2d import load_image, draw_rectangle
 
 import player
+from projectile import ProjectilePool
 
 # 속도 상수
 PIXEL_PER_METER = (10.0 / 0.3)
 BULLET_SPEED_KMPH = 60.0
 BULLET_SPEED_PPS = (BULLET_SPEED_KMPH * 1000.0 / 60.0 / 60.0 * PIXEL_PER_METER)
 
-class Bullet:
-    image = None
-
-    def __init__(self, x, y, angle):
-        if Bullet.image == None:
-            Bullet.image = load_image('./Assets/Weapon/BULLET_32X32X1.png')
-
-        self.x, self.y = x, y
-        self.spawn_x, self.spawn_y = x, y
-        self.angle = angle
+BULLET_RADIUS = 32
+BULLET_MAX_RANGE = 1920 * 2
 
-        self.dx = math.cos(self.angle) * BULLET_SPEED_PPS
-        self.dy = math.sin(self.angle) * BULLET_SPEED_PPS
 
-        self.radius = 32
-        self.max_range_sq = (1920 * 2) ** 2
-
-    def update(self):
-        self.x += self.dx * game_framework.frame_time
-        self.y += self.dy * game_framework.frame_time
+class BulletPool(ProjectilePool):
+    """ 적(보스, 총)이 쏘는 총알 전체. bullets.spawn(x, y, angle)로 발사합니다. """
+    image = None
 
-        dist_sq = (self.x - self.spawn_x)**2 + (self.y - self.spawn_y)**2
-        if dist_sq > self.max_range_sq:
-            import game_world
-            game_world.remove_object(self)
+    def __init__(self):
+        super().__init__(BULLET_SPEED_PPS, BULLET_RADIUS, BULLET_RADIUS, BULLET_MAX_RANGE)
 
     def draw(self, camera):
-        self.image.draw(self.x - camera.world_l, self.y - camera.world_b, self.radius, self.radius)
-
-    def get_bb(self):
-        return self.x - self.radius, self.y - self.radius, self.x + self.radius, self.y + self.radius
-
-    def handle_collision(self, group, other):
+        if BulletPool.image == None:
+            BulletPool.image = load_image('./Assets/Weapon/BULLET_32X32X1.png')
+        # 화면에 보이는 총알만 그림
+        xs, ys = self.x, self.y
+        l, b = camera.world_l, camera.world_b
+        for i in self.visible_indices(camera, BULLET_RADIUS).tolist():
+            self.image.draw(xs[i] - l, ys[i] - b, BULLET_RADIUS, BULLET_RADIUS)
+
+    def on_hit(self, group, i, other):
         if group == 'player:enemy_bullet':
             if other.state_machine.cur_state == other.ROLL:
                 return
-            import game_world
-            game_world.remove_object(self)
+            self.kill(i)
 
         elif group == 'sword:enemy_bullet':
             # 💖 [수정] 칼로 총알을 베었을 때 play_mode에 알림
-            import game_world
             import play_mode
             play_mode.stage_1_cleared_condition = True # 미션 1 클리어 조건 달성
-            game_world.remove_object(self)
\ No newline at end of file
+            self.kill(i)
+
+
+bullets = BulletPool()
@@ -1,52 +1,96 @@
+import math
+import numpy as np
+
 world = [[] for _ in range(4)]
-collision_pairs = {}
+collision_pairs = {}  # Key: 그룹, Value: [a쪽, b쪽] (dict를 순서 있는 집합으로 사용: dict[o] = None)
+collision_groups_of = {}  # Key: 오브젝트, Value: 속한 (그룹, 쪽) 목록 -> 제거할 때 자기 그룹만 확인
+
+# 💖 [추가] 충돌 검사 브로드페이즈 (공간 해시)
+COLLISION_CELL_SIZE = 256  # 기본 셀 크기 (px), 그룹별로 set_collision_cell_size로 변경
+collision_cell_sizes = {}  # Key: 그룹, Value: 셀 크기
+collision_stats = {}       # Key: 그룹, Value: {'candidates': 후보 쌍 수, 'hits': 실제 충돌 수} (마지막 프레임)
+
+# 💖 [추가] 제거 대기열: update/충돌 처리 중에 리스트를 건드리지 않도록 프레임마다 한 번에 제거
+pending_removals = {}  # dict를 순서 있는 집합으로 사용
 
 def add_object(o, depth = 0):
-    world[depth].append(o)
+    if getattr(o, '_world_layer', None) is not None:
+        pending_removals.pop(o, None)  # 이미 월드에 있음 (제거 대기 중이었다면 취소)
+        return
+    layer = world[depth]
+    o._world_layer = depth
+    o._world_index = len(layer)  # 레이어 리스트 안의 위치 -> 제거할 때 찾을 필요 없음
+    layer.append(o)
 
 def add_objects(ol, depth = 0):
-    world[depth] += ol
+    for o in ol:
+        add_object(o, depth)
 
 
 def update():
     for layer in world:
         for o in layer:
+            if pending_removals and o in pending_removals:
+                continue
             o.update()
 
 
 def render(camera): # 💖 [수정] camera 매개변수 추가
     for layer in world:
         for o in layer:
+            if pending_removals and o in pending_removals:
+                continue
             o.draw(camera) # 💖 [수정] o.draw에 camera 전달
 
 def remove_collision_object(o):
-    for pairs in collision_pairs.values():
-        if o in pairs[0]:
-            pairs[0].remove(o)
-        if o in pairs[1]:
-            pairs[1].remove(o)
+    groups = collision_groups_of.pop(o, None)
+    if groups is None:
+        return
+    for group, side in groups:
+        collision_pairs[group][side].pop(o, None)
 
 
 def remove_object(o):
-    for layer in world:
-        if o in layer:
-            layer.remove(o)
-            remove_collision_object(o)
-            return
-#    raise ValueError('Cannot delete non existing object')
+    """ 제거 예약: 충돌 그룹에서는 바로 빠지고, 월드에서는 flush_removals 때 빠집니다. """
+    if getattr(o, '_world_layer', None) is None or o in pending_removals:
+        return  # 월드에 없거나 이미 예약됨
+    pending_removals[o] = None
+    remove_collision_object(o)
+
+
+def flush_removals():
+    """ 예약된 오브젝트를 레이어에서 뺍니다. 마지막 원소를 빈자리로 옮기므로 (swap-pop) 레이어 안의 순서는 바뀔 수 있습니다. """
+    for o in pending_removals:
+        layer = world[o._world_layer]
+        last = layer.pop()
+        if last is not o:
+            layer[o._world_index] = last
+            last._world_index = o._world_index
+        o._world_layer = None
+        o._world_index = None
+    pending_removals.clear()
 
 
 def clear():
     global world, collision_pairs
 
-    objects = [[] for _ in range(4)]
+    for layer in world:
+        for o in layer:
+            o._world_layer = None
+    world = [[] for _ in range(4)]
     collision_pairs = {}
+    collision_groups_of.clear()
+    pending_removals.clear()
 
 
 
 def collide(a, b):
-    left_a, bottom_a, right_a, top_a = a.get_bb()
-    left_b, bottom_b, right_b, top_b = b.get_bb()
+    return collide_bb(a.get_bb(), b.get_bb())
+
+
+def collide_bb(bb_a, bb_b):
+    left_a, bottom_a, right_a, top_a = bb_a
+    left_b, bottom_b, right_b, top_b = bb_b
 
     if left_a > right_b: return False
     if right_a < left_b: return False
@@ -56,29 +100,234 @@ def collide(a, b):
     return True
 
 
+def _add_to_group(group, side, o):
+    members = collision_pairs[group][side]
+    if o in members:
+        return  # 같은 그룹에 중복 등록하지 않음
+    members[o] = None
+    collision_groups_of.setdefault(o, []).append((group, side))
+
+
+def _remove_from_group(group, side, o):
+    members = collision_pairs[group][side]
+    if o not in members:
+        return
+    del members[o]
+    groups = collision_groups_of[o]
+    groups.remove((group, side))
+    if not groups:
+        del collision_groups_of[o]
+
+
 def add_collision_pair(group, a, b):
     if group not in collision_pairs:
         print(f'Added new group {group}')
-        collision_pairs[group] = [ [], [] ]
+        collision_pairs[group] = [ {}, {} ]
     if a:
-        collision_pairs[group][0].append(a)
+        _add_to_group(group, 0, a)
     if b:
-        collision_pairs[group][1].append(b)
+        _add_to_group(group, 1, b)
 
 
 def remove_collision_pair(group, a, b):
     if group in collision_pairs:
-        if a and a in collision_pairs[group][0]:
-            collision_pairs[group][0].remove(a)
-        if b and b in collision_pairs[group][1]:
-            collision_pairs[group][1].remove(b)
+        if a:
+            _remove_from_group(group, 0, a)
+        if b:
+            _remove_from_group(group, 1, b)
+
+
+def set_collision_cell_size(group, size):
+    """ 그룹의 공간 해시 셀 크기를 정합니다. (보통 그 그룹에서 가장 큰 바운딩 박스 정도가 적당) """
+    collision_cell_sizes[group] = size
+
+
+def get_collision_stats():
+    return collision_stats
+
+
+def _cell_range(bb, inv_cell):
+    left, bottom, right, top = bb
+    return (math.floor(left * inv_cell), math.floor(bottom * inv_cell),
+            math.floor(right * inv_cell), math.floor(top * inv_cell))
+
+
+def _gather(members, bbs, expanded):
+    """ 그룹 한쪽의 충돌체 목록과 (N,4) 바운딩 박스 배열.
+    투사체 풀처럼 get_bodies가 있는 오브젝트는 살아 있는 한 발씩(Ref) 펼칩니다. """
+    bodies = []
+    parts = []
+    singles = []
+    for o in members:
+        if hasattr(o, 'get_bodies'):
+            found = expanded.get(o)
+            if found is None:
+                found = expanded[o] = o.get_bodies()
+            refs, boxes = found
+            if refs:
+                bodies.extend(refs)
+                parts.append(boxes)
+        else:
+            if o not in bbs:
+                bbs[o] = o.get_bb()
+            singles.append(o)
+    if singles:
+        bodies.extend(singles)
+        parts.append(np.array([bbs[o] for o in singles], dtype=float))
+    if not parts:
+        return bodies, None
+    return bodies, np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+
+def _is_alive(o, members):
+    pool = getattr(o, 'pool', None)
+    if pool is not None:  # 투사체 한 발: 풀이 그룹에 있고 그 발이 아직 살아 있어야 함
+        return pool in members and o.alive
+    return o in members
+
+
+def _has_bodies(members):
+    for o in members:
+        if hasattr(o, 'get_bodies'):
+            return True
+    return False
+
+
+def _cell_entries(boxes, inv_cell):
+    """ 박스마다 겹치는 셀을 모두 나열: (셀 키 배열, 박스 인덱스 배열) """
+    lo = np.floor(boxes[:, :2] * inv_cell).astype(np.int64)
+    hi = np.floor(boxes[:, 2:] * inv_cell).astype(np.int64)
+    nx = hi[:, 0] - lo[:, 0] + 1
+    counts = nx * (hi[:, 1] - lo[:, 1] + 1)
+    box = np.repeat(np.arange(len(boxes)), counts)
+    # 박스 안에서 몇 번째 셀인지 -> (cx, cy)
+    k = np.arange(len(box)) - np.repeat(np.cumsum(counts) - counts, counts)
+    cx = lo[box, 0] + k % nx[box]
+    cy = lo[box, 1] + k // nx[box]
+    return (cx << 32) ^ (cy & 0xFFFFFFFF), box
+
+
+def _candidate_pairs(boxes_a, boxes_b, inv_cell):
+    """ 공간 해시 브로드페이즈 (배열 버전): 같은 셀을 공유하는 (a, b) 인덱스 쌍, a 순서로 정렬됨 """
+    keys_a, box_a = _cell_entries(boxes_a, inv_cell)
+    keys_b, box_b = _cell_entries(boxes_b, inv_cell)
+
+    # b쪽 셀 항목을 키로 정렬해 두고, a쪽 항목마다 같은 키 구간을 찾음
+    order = np.argsort(keys_b, kind='stable')
+    keys_b, box_b = keys_b[order], box_b[order]
+    start = np.searchsorted(keys_b, keys_a, side='left')
+    count = np.searchsorted(keys_b, keys_a, side='right') - start
+
+    ia = np.repeat(box_a, count)
+    offset = np.arange(len(ia)) - np.repeat(np.cumsum(count) - count, count)
+    ib = box_b[np.repeat(start, count) + offset]
+
+    # 여러 셀을 함께 걸친 쌍은 한 번만
+    pair = np.unique(ia * len(boxes_b) + ib)
+    return pair // len(boxes_b), pair % len(boxes_b)
+
+
+def _collide_batched(group, pairs, bbs, expanded):
+    """ 투사체 풀이 있는 그룹: 바운딩 박스를 (N,4) 배열로 모아 NumPy로 한 번에 비교
+
+    한쪽이 하나뿐이면(플레이어 vs 총알들) 바로 브로드캐스팅하고,
+    양쪽 다 여럿이면 배열 공간 해시로 같은 셀에 있는 후보 쌍만 골라서 검사합니다.
+    """
+    bodies_a, boxes_a = _gather(pairs[0], bbs, expanded)
+    bodies_b, boxes_b = _gather(pairs[1], bbs, expanded)
+    if not bodies_a or not bodies_b:
+        return 0, 0
+
+    if len(bodies_a) == 1 or len(bodies_b) == 1:
+        ia, ib = np.nonzero(np.ones((len(bodies_a), len(bodies_b)), dtype=bool))
+    else:
+        inv_cell = 1.0 / collision_cell_sizes.get(group, COLLISION_CELL_SIZE)
+        ia, ib = _candidate_pairs(boxes_a, boxes_b, inv_cell)
+    candidates = len(ia)
+
+    a = boxes_a[ia]
+    b = boxes_b[ib]
+    # collide_bb와 같은 조건 (경계가 닿아도 충돌)
+    hit = ((a[:, 0] <= b[:, 2]) & (a[:, 2] >= b[:, 0]) &
+           (a[:, 1] <= b[:, 3]) & (a[:, 3] >= b[:, 1]))
+
+    hits = 0
+    for i, j in zip(ia[hit].tolist(), ib[hit].tolist()):  # a 순서대로
+        oa, ob = bodies_a[i], bodies_b[j]
+        # 앞선 충돌 처리에서 이미 빠진 오브젝트는 무시
+        if not _is_alive(oa, pairs[0]) or not _is_alive(ob, pairs[1]):
+            continue
+        hits += 1
+        oa.handle_collision(group, ob)
+        ob.handle_collision(group, oa)
+    return candidates, hits
+
+
+def _collide_hashed(group, pairs, bbs):
+    """ 일반 오브젝트끼리의 그룹: 공간 해시로 같은 셀에 있는 쌍만 검사 """
+    # 충돌 처리 중에 그룹이 바뀔 수 있으므로 복사본으로 순회
+    bodies_a = list(pairs[0])
+    bodies_b = list(pairs[1])
+    for o in bodies_a + bodies_b:
+        if o not in bbs:
+            bbs[o] = o.get_bb()
+
+    inv_cell = 1.0 / collision_cell_sizes.get(group, COLLISION_CELL_SIZE)
+
+    # 1. b쪽을 셀에 넣음 (매 프레임 새로 만듦)
+    grid = {}
+    for b in bodies_b:
+        x0, y0, x1, y1 = _cell_range(bbs[b], inv_cell)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = grid.get((cx, cy))
+                if cell is None:
+                    grid[(cx, cy)] = [b]
+                else:
+                    cell.append(b)
+
+    # 2. a마다 겹치는 셀에 있는 b만 후보로 검사
+    candidates = hits = 0
+    for a in bodies_a:
+        bb_a = bbs[a]
+        x0, y0, x1, y1 = _cell_range(bb_a, inv_cell)
+        seen = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = grid.get((cx, cy))
+                if cell is None:
+                    continue
+                for b in cell:
+                    if b in seen:
+                        continue
+                    seen.add(b)
+                    candidates += 1
+                    if collide_bb(bb_a, bbs[b]):
+                        # 앞선 충돌 처리에서 이미 빠진 오브젝트는 무시
+                        if a not in pairs[0] or b not in pairs[1]:
+                            continue
+                        hits += 1
+                        a.handle_collision(group, b)
+                        b.handle_collision(group, a)
+    return candidates, hits
 
 
 def handle_collisions():
-    collided_pairs = []
+    # 이번 프레임의 바운딩 박스 (오브젝트당 get_bb는 한 번만 호출)
+    bbs = {}
+    expanded = {}  # Key: 투사체 풀, Value: 이번 프레임의 (Ref 목록, 박스 배열)
+
     for group, pairs in collision_pairs.items():
-        for a in pairs[0]:
-            for b in pairs[1]:
-                if collide(a, b):
-                    a.handle_collision(group, b)
-                    b.handle_collision(group, a)
\ No newline at end of file
+        stats = collision_stats.get(group)
+        if stats is None:
+            stats = collision_stats[group] = {'candidates': 0, 'hits': 0}
+        if not pairs[0] or not pairs[1]:
+            stats['candidates'] = stats['hits'] = 0
+            continue
+
+        if _has_bodies(pairs[0]) or _has_bodies(pairs[1]):
+            candidates, hits = _collide_batched(group, pairs, bbs, expanded)
+        else:
+            candidates, hits = _collide_hashed(group, pairs, bbs)
+        stats['candidates'] = candidates
+        stats['hits'] = hits
@@ -2,9 +2,8 @@ import math
 import random
 from pico2d import load_image,load_wav
 import game_framework
-import game_world
 from state_machine import StateMachine
-from bullet import Bullet
+from bullet import bullets
 
 
 # -------------------------------------------------------------------
@@ -68,10 +67,7 @@ class Shoot:
         bx = self.gun.x + math.cos(final_angle) * spawn_dist
         by = self.gun.y + math.sin(final_angle) * spawn_dist
 
-        bullet = Bullet(bx, by, final_angle)
-        game_world.add_object(bullet, 2)
-        game_world.add_collision_pair('player:enemy_bullet', None, bullet)
-        game_world.add_collision_pair('sword:enemy_bullet', None, bullet)
+        bullets.spawn(bx, by, final_angle)
 
         self.gun.gunsound.play()
 
@@ -10,7 +10,8 @@ from camera import Camera
 import enemy1
 import boss
 from map import Map
-from bullet import Bullet  # 총알 생성용
+from bullet import bullets  # 총알 생성용
+from sword_bullet import sword_bullets
 
 from pico2d import hide_cursor, show_cursor
 # ---------------------------------------------------------
@@ -79,10 +80,17 @@ def init():
     # 3. 카메라 생성
     camera = Camera()
 
+    # 💖 [추가] 투사체 풀: 총알/검기는 한 풀이 전부 관리하므로 월드와 충돌 그룹에는 풀만 등록
+    bullets.clear()
+    sword_bullets.clear()
+    game_world.add_object(sword_bullets, 2)  # 레이어 2 (플레이어와 적 사이)
+    game_world.add_object(bullets, 2)
+
     # 4. 충돌 그룹 초기화
     game_world.add_collision_pair('sword:enemy', player.sword, None)
-    game_world.add_collision_pair('player:enemy_bullet', player, None)
-    game_world.add_collision_pair('sword:enemy_bullet', player.sword, None)
+    game_world.add_collision_pair('player:enemy_bullet', player, bullets)
+    game_world.add_collision_pair('sword:enemy_bullet', player.sword, bullets)
+    game_world.add_collision_pair('sword_bullet:enemy', sword_bullets, None)
 
     # 미션 초기화
     stage = 0
@@ -116,10 +124,7 @@ def spawn_bullet_to_player(count=1):
     for _ in range(count):
         bx, by = get_random_offscreen_pos()
         angle = math.atan2(player.y - by, player.x - bx)
-        bullet = Bullet(bx, by, angle)
-        game_world.add_object(bullet, 2)
-        game_world.add_collision_pair('player:enemy_bullet', None, bullet)
-        game_world.add_collision_pair('sword:enemy_bullet', None, bullet)
+        bullets.spawn(bx, by, angle)
 
 
 def get_enemy_count():
@@ -137,10 +142,7 @@ def get_boss_count():
 
 
 def get_bullet_count():
-    count = 0
-    for o in game_world.world[2]:
-        if isinstance(o, Bullet): count += 1
-    return count
+    return bullets.count
 
 
 # ---------------------------------------------------------
@@ -157,6 +159,7 @@ def update():
     player.mouse_world_y = camera.world_b + player.mouse_y
 
     game_world.handle_collisions()
+    game_world.flush_removals()
 
     # === 미션 진행 로직 ===
 
@@ -180,8 +183,7 @@ def update():
                 spawn_bullet_to_player(1)
 
         if stage_1_cleared_condition:
-            for o in game_world.world[2]:
-                if isinstance(o, Bullet): game_world.remove_object(o)
+            bullets.clear()
             stage = 2
             stage_timer = 0.0
             player_start_hp = player.hp
@@ -197,8 +199,7 @@ def update():
             print("Hit! Retrying Stage 2...")
             player.hp = player_start_hp
             stage_timer = 0.0
-            for o in game_world.world[2]:
-                if isinstance(o, Bullet): game_world.remove_object(o)
+            bullets.clear()
 
         if stage_timer > 2.0 and get_bullet_count() == 0 and player.hp >= player_start_hp:
             stage = 3
@@ -0,0 +1,167 @@
+import math
+import numpy as np
+import game_framework
+
+
+class ProjectileRef:
+    """ 투사체 풀의 한 발. 충돌 상대에게는 이 오브젝트가 넘어갑니다. (x, y, dx, dy, angle) """
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index  # 풀 배열의 슬롯 번호 (이 Ref는 슬롯과 함께 재사용됨)
+
+    @property
+    def x(self):
+        return float(self.pool.x[self.index])
+
+    @property
+    def y(self):
+        return float(self.pool.y[self.index])
+
+    @property
+    def dx(self):
+        return float(self.pool.dx[self.index])
+
+    @property
+    def dy(self):
+        return float(self.pool.dy[self.index])
+
+    @property
+    def angle(self):
+        return float(self.pool.angle[self.index])
+
+    @property
+    def alive(self):
+        return bool(self.pool.alive[self.index])
+
+    def get_bb(self):
+        return self.pool.get_bb(self.index)
+
+    def handle_collision(self, group, other):
+        self.pool.on_hit(group, self.index, other)
+
+
+class ProjectilePool:
+    """ 같은 종류의 투사체를 NumPy 배열(구조체 배열이 아닌 필드별 배열)로 모아 한 번에 처리합니다.
+
+    - 월드에는 풀 하나만 add_object 하고, 충돌 그룹에도 풀을 등록합니다.
+    - update()에서 모든 투사체를 한 번에 이동시키고 사거리를 벗어난 것을 지웁니다.
+    - 죽은 슬롯은 free 목록에 넣었다가 다음 spawn에서 다시 씁니다.
+    """
+
+    def __init__(self, speed, half_w, half_h, max_range, capacity=256):
+        self.speed = speed
+        self.half_w = half_w  # 충돌 박스 반폭/반높이
+        self.half_h = half_h
+        self.max_range_sq = max_range ** 2
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.angle = np.zeros(capacity)
+        self.spawn_x = np.zeros(capacity)
+        self.spawn_y = np.zeros(capacity)
+        self.range_sq = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.refs = [ProjectileRef(self, i) for i in range(capacity)]
+
+        self.top = 0     # 한 번이라도 쓴 슬롯 수 ([0, top) 구간만 계산)
+        self.free = []   # top 아래에서 비어 있는 슬롯
+        self.count = 0   # 살아 있는 투사체 수
+
+    @property
+    def capacity(self):
+        return len(self.refs)
+
+    def _grow(self):
+        old = self.capacity
+        new = old * 2
+        for field in ('x', 'y', 'dx', 'dy', 'angle', 'spawn_x', 'spawn_y', 'range_sq', 'alive'):
+            arr = getattr(self, field)
+            grown = np.zeros(new, dtype=arr.dtype)
+            grown[:old] = arr
+            setattr(self, field, grown)
+        self.refs.extend(ProjectileRef(self, i) for i in range(old, new))
+
+    def spawn(self, x, y, angle, max_range=None):
+        if self.free:
+            i = self.free.pop()
+        else:
+            if self.top == self.capacity:
+                self._grow()
+            i = self.top
+            self.top += 1
+
+        self.x[i] = self.spawn_x[i] = x
+        self.y[i] = self.spawn_y[i] = y
+        self.angle[i] = angle
+        self.dx[i] = math.cos(angle) * self.speed
+        self.dy[i] = math.sin(angle) * self.speed
+        self.range_sq[i] = self.max_range_sq if max_range is None else max_range ** 2
+        self.alive[i] = True
+        self.count += 1
+        return self.refs[i]
+
+    def kill(self, i):
+        if not self.alive[i]:
+            return  # 이미 지워짐
+        self.alive[i] = False
+        self.free.append(i)
+        self.count -= 1
+
+    def _kill_many(self, indices):
+        self.alive[indices] = False
+        self.free.extend(indices.tolist())
+        self.count -= len(indices)
+
+    def clear(self):
+        self.alive[:] = False
+        self.top = 0
+        self.free.clear()
+        self.count = 0
+
+    def alive_indices(self):
+        return np.flatnonzero(self.alive[:self.top])
+
+    def update(self):
+        if self.count == 0:
+            return
+        n = self.top
+        dt = game_framework.frame_time
+        # 죽은 슬롯도 같이 움직여도 상관없으므로 마스크 없이 통째로 계산
+        self.x[:n] += self.dx[:n] * dt
+        self.y[:n] += self.dy[:n] * dt
+
+        dist_sq = (self.x[:n] - self.spawn_x[:n]) ** 2 + (self.y[:n] - self.spawn_y[:n]) ** 2
+        expired = np.flatnonzero(self.alive[:n] & (dist_sq > self.range_sq[:n]))
+        if len(expired):
+            self._kill_many(expired)
+
+    def visible_indices(self, camera, margin):
+        """ 화면(+margin) 안에 있는 살아 있는 투사체의 슬롯 번호 """
+        n = self.top
+        x, y = self.x[:n], self.y[:n]
+        l, b = camera.world_l - margin, camera.world_b - margin
+        r = camera.world_l + camera.canvas_width + margin
+        t = camera.world_b + camera.canvas_height + margin
+        return np.flatnonzero(self.alive[:n] & (x > l) & (x < r) & (y > b) & (y < t))
+
+    def get_bb(self, i):
+        x, y = float(self.x[i]), float(self.y[i])
+        return x - self.half_w, y - self.half_h, x + self.half_w, y + self.half_h
+
+    def get_bodies(self):
+        """ 충돌 검사용: 살아 있는 투사체의 Ref 목록과 (N,4) 바운딩 박스 배열 """
+        idx = self.alive_indices()
+        x, y = self.x[idx], self.y[idx]
+        boxes = np.stack([x - self.half_w, y - self.half_h, x + self.half_w, y + self.half_h], axis=1)
+        refs = self.refs
+        return [refs[i] for i in idx.tolist()], boxes
+
+    def on_hit(self, group, i, other):
+        """ 슬롯 i의 투사체가 other와 부딪혔을 때 (하위 클래스에서 구현) """
+        pass
+
+    def draw(self, camera):
+        pass
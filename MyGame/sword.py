@@ -2,7 +2,7 @@ import math
 from pico2d import load_image, draw_rectangle, SDL_MOUSEBUTTONDOWN, SDL_BUTTON_LEFT,load_wav
 import game_framework
 from state_machine import StateMachine
-from sword_bullet import SwordBullet # 💖 [추가] 임포트
+from sword_bullet import sword_bullets # 💖 [추가] 임포트
 
 def attack_down(e):
     """ 마우스 왼쪽 버튼이 눌렸는지 확인하는 이벤트 핸들러 """
@@ -42,16 +42,13 @@ class Idle:
         self.sword.draw_rotated_image(camera)
 
     def fire_sword_bullet(self, angle):
-        import game_world
         # 발사 위치: 플레이어 중심에서 약간 앞
         spawn_dist = 30
         bx = self.sword.player.x + math.cos(angle) * spawn_dist
         by = self.sword.player.y + math.sin(angle) * spawn_dist
 
-        bullet = SwordBullet(bx, by, angle)
-        game_world.add_object(bullet, 2)  # 레이어 2 (플레이어와 적 사이)
-        # 💖 [핵심] 충돌 그룹에 등록
-        game_world.add_collision_pair('sword_bullet:enemy', bullet, None)
+        # 💖 [핵심] 검기 풀은 play_mode.init에서 레이어 2와 'sword_bullet:enemy' 그룹에 등록됨
+        sword_bullets.spawn(bx, by, angle)
 
 
 # 💖 [추가] 칼의 'Swing' 상태 (휘두르기)